@@ -1,5 +1,7 @@
 import asyncio
 import random
+from typing import Optional
+from fastapi import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -10,13 +12,28 @@ from app.core.utils.response.success import Success
 from app.core.utils.token_manager import token_manager
 from app.crud import user_crud
 from app.models import UserRole, User
-from app.schemas import UserResponse
+from app.schemas.adapters import USER_LIST_ADAPTER, render_json, user_response
 
 
 # -------------------- LOGIN --------------------
 import logging
 logger = logging.getLogger(__name__)
 
+_fake_hash: Optional[str] = None
+
+
+async def fake_password_hash() -> str:
+    """
+    bcrypt hash checked for unknown emails; hashed once, on the password pool.
+
+    Warmed in the app lifespan so no login pays for it.
+    """
+    global _fake_hash
+    if _fake_hash is None:
+        _fake_hash = await security_manager.hash_password("fake_password")
+    return _fake_hash
+
+
 async def login(db: AsyncSession, email, password: str, unique_id: str):
     """
     Authenticate user with email, password, and unique_id.
@@ -31,13 +48,12 @@ async def login(db: AsyncSession, email, password: str, unique_id: str):
     db_user = await user_crud.get_user_by_email(db=db, email=email)
 
     # Placeholders for timing attack resistance
-    fake_hash = security_manager.hash_password("fake_password")
     fake_unique_id = "fake_unique_id_12345"
 
-    hashed_password_to_check = db_user.hashed_password if db_user else fake_hash
+    hashed_password_to_check = db_user.hashed_password if db_user else await fake_password_hash()
     unique_id_to_check = db_user.unique_id if db_user else fake_unique_id
 
-    password_ok = security_manager.verify_password(password, hashed_password_to_check)
+    password_ok = await security_manager.verify_password(password, hashed_password_to_check)
     unique_id_ok = unique_id == unique_id_to_check
 
     if not (db_user and password_ok and unique_id_ok):
@@ -55,7 +71,7 @@ async def login(db: AsyncSession, email, password: str, unique_id: str):
     return Success.login_success(
         access_token=tokens.access_token,
         refresh_token=tokens.refresh_token,
-        user=UserResponse.model_validate(db_user),
+        user=user_response(db_user),
     )
 
 
@@ -90,6 +106,14 @@ async def verify_email(db: AsyncSession, email, verification_code: str):
 
 
 # -------------------- ROLE MANAGEMENT --------------------
+# new role -> (role, unique_id) factory; the same-role case is rejected before lookup
+_ROLE_TRANSITIONS = {
+    UserRole.ADMIN: lambda: (UserRole.ADMIN, IDGenerator.generate_id(IDPrefix.ADMIN, 12)),
+    UserRole.SUPER_ADMIN: lambda: (UserRole.SUPER_ADMIN, IDGenerator.generate_id(IDPrefix.SUPER_ADMIN, 12)),
+    UserRole.USER: lambda: (UserRole.USER, None),
+}
+
+
 async def update_role(db: AsyncSession, actor: User, target_email, new_role: UserRole):
     """
     Update the role of a user.
@@ -117,20 +141,11 @@ async def update_role(db: AsyncSession, actor: User, target_email, new_role: Use
     if db_user.role == new_role:
         raise Exceptions.already_verified(detail="already upgrade role")
     # --- Role transition logic ---
-    if new_role == UserRole.ADMIN:
-        db_user.role = UserRole.ADMIN
-        db_user.unique_id = IDGenerator.generate_id(IDPrefix.ADMIN, 12)
-    elif new_role == UserRole.SUPER_ADMIN:
-        db_user.role = UserRole.SUPER_ADMIN
-        db_user.unique_id = IDGenerator.generate_id(IDPrefix.SUPER_ADMIN, 12)
-    elif new_role == UserRole.USER:
-        if db_user.role == UserRole.USER:
-            raise Exceptions.forbidden("User already has USER role")
-        db_user.role = UserRole.USER
-        db_user.unique_id = None
+    transition = _ROLE_TRANSITIONS.get(new_role)
+    if transition is not None:
+        db_user.role, db_user.unique_id = transition()
 
     await db.commit()
-    await db.refresh(db_user)
     return Success.ok(detail="User role update success")
 
 
@@ -222,7 +237,7 @@ async def reset_password_with_otp(
         raise Exceptions.invalid_credentials("Invalid OTP unique_id")
 
     # Save new password
-    db_user.hashed_password = security_manager.hash_password(new_password)
+    db_user.hashed_password = await security_manager.hash_password(new_password)
 
     # Rotate unique_id again (invalidate OTP after use)
     if db_user.role == UserRole.SUPERUSER:
@@ -241,4 +256,6 @@ async def reset_password_with_otp(
     )
 
 async def _get_user_lists(db: AsyncSession):
-    return await user_crud.get_users(db)
\ No newline at end of file
+    """List users as UserResponse JSON; the list is validated and dumped in one adapter call."""
+    users = await user_crud.get_users(db)
+    return Response(content=render_json(USER_LIST_ADAPTER, users), media_type="application/json")
\ No newline at end of file
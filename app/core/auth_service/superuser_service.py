@@ -1,3 +1,4 @@
+from sqlalchemy import Boolean, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -8,6 +9,12 @@ from app.core.utils.response.success import Success
 from app.crud import user_crud
 from app.models import User, UserRole
 
+# Boolean columns on users, resolved once at import instead of introspected per request
+_BOOL_FLAGS: frozenset[str] = frozenset(
+    column.name for column in User.__table__.columns if isinstance(column.type, Boolean)
+)
+_FLAG_LABELS = {flag: flag.replace('_', ' ').title() for flag in _BOOL_FLAGS}
+
 
 async def create_superuser(
         db: AsyncSession,
@@ -23,7 +30,7 @@ async def create_superuser(
     if existing:
         raise Exceptions.forbidden("Superuser already exists")
 
-    hashed_pw = security_manager.hash_password(password)
+    hashed_pw = await security_manager.hash_password(password)
     unique_id = IDGenerator.generate_id(IDPrefix.SUPERUSER, total_length=12)
 
     return await user_crud.create(
@@ -35,34 +42,47 @@ async def create_superuser(
     )
 
 
-async def toggle_flag(db: AsyncSession, actor: User, target_email, flag: str):
-    db_user = await user_crud.get(db=db, email=target_email)
-    if not db_user:
+async def _ensure_user_exists(db: AsyncSession, email) -> None:
+    """404 for an unknown target, so it is reported before any rule or flag error."""
+    if not await user_crud.exists(db, filters={"email": email}):
         raise Exceptions.not_found("User not found")
 
+
+async def toggle_flag(db: AsyncSession, actor: User, target_email, flag: str):
     # RULES
+    target_roles = None
     if actor.role == UserRole.SUPERUSER:
         pass  # full control
     elif actor.role == UserRole.SUPER_ADMIN:
         # Only allow `admin_approval` flag on USER/ADMIN targets
         if flag != "admin_approval":
+            await _ensure_user_exists(db, target_email)
             raise Exceptions.forbidden("SUPER_ADMIN can only toggle admin_approval")
-        if db_user.role not in [UserRole.USER, UserRole.ADMIN]:
-            raise Exceptions.forbidden("SUPER_ADMIN can only toggle flags for USER/ADMIN")
+        target_roles = [UserRole.USER, UserRole.ADMIN]
     else:
+        await _ensure_user_exists(db, target_email)
         raise Exceptions.forbidden("Only SUPERUSER or SUPER_ADMIN can toggle flags")
 
     # Safety check for flag existence
-    if not hasattr(db_user, flag) or not isinstance(getattr(db_user, flag), bool):
+    if flag not in _BOOL_FLAGS:
+        await _ensure_user_exists(db, target_email)
         raise Exceptions.bad_request(f"Invalid boolean flag '{flag}'")
+    column = User.__table__.c[flag]
+
+    # Flip the flag in one UPDATE ... RETURNING instead of load, mutate, commit, refresh
+    stmt = update(User).where(User.email == target_email).values({column: ~column})
+    if target_roles is not None:
+        stmt = stmt.where(User.role.in_(target_roles))
+    row = (await db.execute(stmt.returning(User.email, column))).first()
 
-    # Flip the flag
-    setattr(db_user, flag, not getattr(db_user, flag))
+    if row is None:
+        # Nothing updated: tell "no such user" apart from a role the actor may not touch
+        await _ensure_user_exists(db, target_email)
+        raise Exceptions.forbidden("SUPER_ADMIN can only toggle flags for USER/ADMIN")
     await db.commit()
-    await db.refresh(db_user)
 
+    email, value = row
     return Success.ok(
-        message=f"{flag.replace('_', ' ').title()} status updated",
-        data={"email": db_user.email, flag: getattr(db_user, flag)},
+        message=f"{_FLAG_LABELS[flag]} status updated",
+        data={"email": email, flag: value},
     )
-
@@ -7,7 +7,7 @@ from app.core.utils.response.exceptions import Exceptions
 from app.core.utils.response.success import Success
 from app.core.utils.token_manager import token_manager
 from app.crud import user_crud
-from app.schemas import UserResponse
+from app.schemas.adapters import user_response
 
 
 async def create_user(db: AsyncSession, email):
@@ -15,8 +15,7 @@ async def create_user(db: AsyncSession, email):
     if existing_user:
         raise Exceptions.email_exist(detail="Email exist please login to continue")
     new_user = await user_crud.create(db=db, email=email)
-    user_response = UserResponse.model_validate(new_user)
-    return Success.account_created(user=user_response)
+    return Success.account_created(user=user_response(new_user))
 
 
 async def login_user(db: AsyncSession, email, verification_code: Optional[str] = None):
@@ -36,7 +35,7 @@ async def login_user(db: AsyncSession, email, verification_code: Optional[str] =
         return Success.login_success(
             access_token=tokens.access_token,
             refresh_token=tokens.refresh_token,
-            user=UserResponse.model_validate(db_user),
+            user=user_response(db_user),
         )
     verification_code = await VerificationManager.generate_code(user_id=db_user.id, db=db)
     return Success.verification_code_sent(verification_code=verification_code)
\ No newline at end of file
@@ -0,0 +1,309 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def dump_json(value: Any) -> bytes:
+    """Encode JSON-ready data (e.g. model_dump(mode='json') output) to bytes."""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+class _MemoryBackend:
+    """In-process TTL + LRU store used when Redis is not configured."""
+
+    def __init__(self, maxsize: int = 4096):
+        self._maxsize = maxsize
+        self._data: "OrderedDict[str, Tuple[Optional[float], bytes]]" = OrderedDict()
+        self._hashes: Dict[str, Dict[str, int]] = {}
+
+    def _alive(self, key: str) -> Optional[bytes]:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def _store(self, key: str, expires_at: Optional[float], value: bytes) -> None:
+        self._data[key] = (expires_at, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return self._alive(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return [self._alive(key) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        self._store(key, expires_at, value)
+
+    async def set_many(self, mapping: Dict[str, bytes], ttl: Optional[int] = None) -> None:
+        expires_at = time.monotonic() + ttl if ttl else None
+        for key, value in mapping.items():
+            self._store(key, expires_at, value)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._data.pop(key, None)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        for key in [k for k in self._data if k.startswith(prefix)]:
+            self._data.pop(key, None)
+
+    async def incr(self, key: str, ttl: Optional[int] = None) -> int:
+        current = self._alive(key)
+        value = int(current) + 1 if current is not None else 1
+        expires_at = self._data[key][0] if current is not None else (time.monotonic() + ttl if ttl else None)
+        self._store(key, expires_at, str(value).encode())
+        return value
+
+    async def hincr(self, name: str, field: str, amount: int = 1) -> int:
+        counters = self._hashes.setdefault(name, {})
+        counters[field] = counters.get(field, 0) + amount
+        return counters[field]
+
+    async def hpop_all(self, name: str) -> Dict[str, int]:
+        return self._hashes.pop(name, {})
+
+    async def close(self) -> None:
+        self._data.clear()
+        self._hashes.clear()
+
+
+class _RedisBackend:
+    """Thin wrapper over redis.asyncio with the same interface as _MemoryBackend."""
+
+    def __init__(self, client):
+        self._client = client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._client.get(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        return await self._client.mget(keys) if keys else []
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self._client.set(key, value, ex=ttl)
+
+    async def set_many(self, mapping: Dict[str, bytes], ttl: Optional[int] = None) -> None:
+        if not mapping:
+            return
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in mapping.items():
+                pipe.set(key, value, ex=ttl)
+            await pipe.execute()
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self._client.delete(*keys)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        keys = [key async for key in self._client.scan_iter(match=f"{prefix}*")]
+        if keys:
+            await self._client.unlink(*keys)
+
+    async def incr(self, key: str, ttl: Optional[int] = None) -> int:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.incr(key)
+            if ttl:
+                pipe.expire(key, ttl, nx=True)
+            value, *_ = await pipe.execute()
+        return value
+
+    async def hincr(self, name: str, field: str, amount: int = 1) -> int:
+        return await self._client.hincrby(name, field, amount)
+
+    async def hpop_all(self, name: str) -> Dict[str, int]:
+        async with self._client.pipeline(transaction=True) as pipe:
+            pipe.hgetall(name)
+            pipe.delete(name)
+            counters, _ = await pipe.execute()
+        return {
+            (k.decode() if isinstance(k, bytes) else k): int(v)
+            for k, v in counters.items()
+        }
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class Cache:
+    """
+    Async key/value cache shared across the app.
+
+    Uses Redis when REDIS_URL is configured and redis is installed,
+    otherwise an in-process TTL store.
+    """
+
+    def __init__(self):
+        self._backend = _MemoryBackend()
+
+    async def connect(self, url: Optional[str] = None) -> None:
+        """Switch to a Redis backend if a URL is given."""
+        if not url:
+            logger.info("Cache using in-process memory backend")
+            return
+
+        try:
+            from redis import asyncio as redis_asyncio
+        except ImportError:
+            logger.warning("REDIS_URL is set but redis is not installed; using memory cache")
+            return
+
+        client = redis_asyncio.from_url(url)
+        await client.ping()
+        self._backend = _RedisBackend(client)
+        logger.info("Cache connected to Redis")
+
+    async def close(self) -> None:
+        await self._backend.close()
+        self._backend = _MemoryBackend()
+
+    @property
+    def shared(self) -> bool:
+        """True when entries are visible to every worker (Redis), False for the in-process store."""
+        return isinstance(self._backend, _RedisBackend)
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._backend.get(key)
+
+    async def get_many(self, keys: List[str]) -> List[Optional[bytes]]:
+        """Fetch several keys in one round-trip (MGET); missing keys come back as None."""
+        return await self._backend.get_many(keys)
+
+    async def set(self, key: str, value: bytes, ttl: Optional[int] = None) -> None:
+        await self._backend.set(key, value, ttl)
+
+    async def set_many(self, mapping: Dict[str, bytes], ttl: Optional[int] = None) -> None:
+        """Store several keys in one pipelined round-trip."""
+        await self._backend.set_many(mapping, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        await self._backend.delete(*keys)
+
+    async def delete_prefix(self, prefix: str) -> None:
+        await self._backend.delete_prefix(prefix)
+
+    async def incr(self, key: str, ttl: Optional[int] = None) -> int:
+        return await self._backend.incr(key, ttl)
+
+    async def hincr(self, name: str, field: str, amount: int = 1) -> int:
+        """Increment a counter inside a hash."""
+        return await self._backend.hincr(name, field, amount)
+
+    async def hpop_all(self, name: str) -> Dict[str, int]:
+        """Atomically read and clear every counter in a hash."""
+        return await self._backend.hpop_all(name)
+
+
+cache = Cache()
+
+
+# Per-process in-flight cache fills, so concurrent misses on one key share a single producer run
+_inflight: Dict[str, "asyncio.Future[Optional[bytes]]"] = {}
+
+
+# Guarded cache calls: a backend failure (e.g. Redis down) is logged and treated as a miss
+# or a dropped write, so cache-backed paths degrade to the database instead of failing.
+async def safe_get(key: str) -> Optional[bytes]:
+    """cache.get that treats a backend failure as a miss."""
+    try:
+        return await cache.get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return None
+
+
+async def safe_get_many(keys: List[str]) -> List[Optional[bytes]]:
+    """cache.get_many that treats a backend failure as every key missing."""
+    try:
+        return await cache.get_many(keys)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {len(keys)} keys: {e}")
+        return [None] * len(keys)
+
+
+async def safe_set(key: str, value: bytes, ttl: Optional[int] = None) -> None:
+    """cache.set that logs and drops a backend failure instead of failing the request."""
+    try:
+        await cache.set(key, value, ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+async def safe_set_many(mapping: Dict[str, bytes], ttl: Optional[int] = None) -> None:
+    """cache.set_many that logs and drops a backend failure."""
+    try:
+        await cache.set_many(mapping, ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {len(mapping)} keys: {e}")
+
+
+async def safe_hincr(name: str, field: str, amount: int = 1) -> Optional[int]:
+    """cache.hincr that logs and drops a backend failure; returns None when the increment was lost."""
+    try:
+        return await cache.hincr(name, field, amount)
+    except Exception as e:
+        logger.warning(f"Cache increment failed for {name}[{field}]: {e}")
+        return None
+
+
+async def cached_json(key: str, ttl: int, producer: Callable[[], Awaitable[Any]]) -> Response:
+    """
+    Serve JSON bytes from the cache, or build them with producer and cache them.
+
+    producer must return JSON-ready data; cache hits skip both the DB and serialization.
+    Concurrent misses on the same key wait for one caller's producer run; if that run
+    fails, the waiters elect a new leader among themselves rather than all rerunning it.
+    Cache backend errors degrade to serving producer() directly.
+    """
+    while True:
+        payload = await safe_get(key)
+        if payload is not None:
+            break
+
+        pending = _inflight.get(key)
+        if pending is not None:
+            payload = await asyncio.shield(pending)
+            if payload is not None:
+                break
+            continue  # The leader failed; the first waiter back takes over
+
+        future = asyncio.get_running_loop().create_future()
+        _inflight[key] = future
+        try:
+            payload = dump_json(await producer())
+        finally:
+            del _inflight[key]
+            future.set_result(payload)
+
+        await safe_set(key, payload, ttl)
+        break
+
+    return Response(content=payload, media_type="application/json")
+
+
+async def cached_value(key: str, ttl: int, producer: Callable[[], Awaitable[Any]]) -> Any:
+    """Like cached_json, but returns the decoded data for callers that post-process it per request."""
+    response = await cached_json(key, ttl, producer)
+    return orjson.loads(response.body) if orjson is not None else json.loads(response.body)
@@ -18,9 +18,19 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str
     POSTGRES_PORT: int = 5432
     POSTGRES_DB: str
+    # Pool sizing is per worker process: keep workers * DB_POOL_MAX
+    # below Postgres max_connections, and raise these per deployment rather than here.
+    # Lower DB_POOL_TIMEOUT to fail fast under bursts once the pool is sized for the load.
     DB_POOL_MIN: int = 2
     DB_POOL_MAX: int = 20
     DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_STATEMENT_CACHE_SIZE: int = 1024
+    DB_QUERY_CACHE_SIZE: int = 1200
+
+    # Cache Configuration
+    REDIS_URL: Optional[str] = None
+    VIEW_COUNT_FLUSH_SECONDS: int = 30
 
     # API Superuser Configuration
     API_SUPERUSER_USERNAME: str
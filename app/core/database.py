@@ -17,7 +17,12 @@ engine = create_async_engine(
     pool_size=settings.DB_POOL_MIN,
     max_overflow=settings.DB_POOL_MAX - settings.DB_POOL_MIN,
     pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Recycle before server/proxy idle timeouts
+    pool_pre_ping=False,  # Recycling handles stale connections; skip the per-checkout ping
+    # Per-connection asyncpg prepared statements; sized for the app's distinct queries
+    connect_args={"prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE},
+    # SQLAlchemy's compiled-SQL cache; room for every filter combination of the search statements
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
     echo=False,  # Disable in production
     future=True,
 )
@@ -37,7 +42,7 @@ AsyncSessionLocal = async_sessionmaker(
 async def get_async_db() -> AsyncGenerator[AsyncSession | Any, Any]:
     """
     Async generator that yields database sessions.
-    Ensures sessions are properly closed after use.
+    The session is closed by the async context manager when the request ends.
     """
     async with AsyncSessionLocal() as session:
         try:
@@ -47,8 +52,6 @@ async def get_async_db() -> AsyncGenerator[AsyncSession | Any, Any]:
             await session.rollback()
             logger.error(f"Database session failed: {str(e)}")
             raise
-        finally:
-            await session.close()
 
 async def init_db():
     """
@@ -1,8 +1,23 @@
 from typing import Annotated, TypeAlias
 from fastapi import Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import cache, safe_get, safe_set
 from app.core.database import get_async_db
+from app.core.utils.response.exceptions import Exceptions
 from app.models import User, UserRole
+from app.models.merchant import MerchantApplicationStatus
+
+MERCHANT_STATUS_CACHE_PREFIX = "merchant:status:"
+MERCHANT_STATUS_CACHE_TTL = 300
+# invalidate_merchant_status only reaches the local worker without Redis, so keep entries short
+MERCHANT_STATUS_LOCAL_CACHE_TTL = 15
+
+# Role sets built once; the checks below are plain set lookups
+_REGULAR_ROLES = frozenset({UserRole.USER})
+_MERCHANT_ROLES = frozenset({UserRole.MERCHANT})
+_ADMIN_ROLES = frozenset({UserRole.ADMIN, UserRole.SUPER_ADMIN, UserRole.SUPERUSER})
+_SUPER_ADMIN_ROLES = frozenset({UserRole.SUPER_ADMIN})
+_SUPER_USER_ROLES = frozenset({UserRole.SUPERUSER})
 
 
 def get_security_manager():
@@ -15,42 +30,70 @@ async def _current_user(
     request: Request,
     db: AsyncSession = Depends(get_async_db)
 ) -> User:
+    """Resolve the authenticated user; FastAPI caches it per request, so role checks below reuse it."""
     return await get_security_manager().get_current_user(request=request, db=db)
 
 async def _regular_user(current_user: User = Depends(_current_user)):
-    if current_user.role not in [UserRole.USER]:
-        from app.core.utils.response.exceptions import Exceptions
+    if current_user.role not in _REGULAR_ROLES:
         raise Exceptions.permission_denied()
     return current_user
 
 
 async def _merchant_user(current_user: User = Depends(_current_user)):
-    if current_user.role not in [UserRole.MERCHANT]:
-        from app.core.utils.response.exceptions import Exceptions
+    if current_user.role not in _MERCHANT_ROLES:
         raise Exceptions.permission_denied()
     return current_user
 
+async def get_merchant_status(db: AsyncSession, user_id: int) -> str:
+    """
+    Merchant application status for a user ("" if none).
+
+    Cached for MERCHANT_STATUS_CACHE_TTL with a shared cache, MERCHANT_STATUS_LOCAL_CACHE_TTL without one.
+    """
+    key = f"{MERCHANT_STATUS_CACHE_PREFIX}{user_id}"
+    cached = await safe_get(key)
+    if cached is not None:
+        return cached.decode()
+
+    from app.crud.merchant_crud import merchant_crud
+    application = await merchant_crud.get_user_application(db, user_id)
+    merchant_status = application.status.value if application else ""
+    ttl = MERCHANT_STATUS_CACHE_TTL if cache.shared else MERCHANT_STATUS_LOCAL_CACHE_TTL
+    await safe_set(key, merchant_status.encode(), ttl)
+    return merchant_status
+
+
+async def invalidate_merchant_status(user_id: int) -> None:
+    """Forget a user's cached merchant status after their application changes."""
+    await cache.delete(f"{MERCHANT_STATUS_CACHE_PREFIX}{user_id}")
+
+
+async def _approved_merchant(
+    current_user: User = Depends(_current_user),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    if await get_merchant_status(db, current_user.id) != MerchantApplicationStatus.APPROVED.value:
+        raise Exceptions.permission_denied("You need to be an approved merchant")
+    return current_user
+
 async def _admin_user(
     current_user: User = Depends(_current_user)
 ) -> User:
-    if current_user.role not in [UserRole.ADMIN, UserRole.SUPER_ADMIN, UserRole.SUPERUSER]:
-        from app.core.utils.response.exceptions import Exceptions
+    if current_user.role not in _ADMIN_ROLES:
         raise Exceptions.permission_denied()
     return current_user
 
 async def _super_admin_user(
     current_user: User = Depends(_current_user)
 ) -> User:
-    if current_user.role not in [UserRole.SUPER_ADMIN]:
-        from app.core.utils.response.exceptions import Exceptions
+    if current_user.role not in _SUPER_ADMIN_ROLES:
         raise Exceptions.permission_denied()
     return current_user
 
 async def _super_user(
     current_user: User = Depends(_current_user)
 ) -> User:
-    if current_user.role not in [UserRole.SUPERUSER]:
-        from app.core.utils.response.exceptions import Exceptions
+    if current_user.role not in _SUPER_USER_ROLES:
         raise Exceptions.permission_denied()
     return current_user
 
@@ -59,6 +102,7 @@ async def _super_user(
 CurrentUser: TypeAlias = Annotated[User, Depends(_current_user)]
 RegularUser: TypeAlias = Annotated[User, Depends(_current_user)]
 MerchantUser: TypeAlias = Annotated[User, Depends(_current_user)]
+ApprovedMerchant: TypeAlias = Annotated[User, Depends(_approved_merchant)]
 AdminUser: TypeAlias = Annotated[User, Depends(_admin_user)]
 SuperAdminUser: TypeAlias = Annotated[User, Depends(_super_admin_user)]
 SuperUser: TypeAlias = Annotated[User, Depends(_super_user)]
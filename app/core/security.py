@@ -1,7 +1,13 @@
 from fastapi import Request, Depends
-from jose import jwt, JWTError
+from functools import lru_cache
+from jose import jwt, JWTError, ExpiredSignatureError
 from passlib.context import CryptContext
+import asyncio
+import os
 import hmac
+import secrets
+import time
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
@@ -15,17 +21,49 @@ from app.models import User, UserRole
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 logger = logging.getLogger(__name__)
 
+TOKEN_DECODE_CACHE_SECONDS = 30
+PASSWORD_KDF_TIMEOUT_SECONDS = 2.0
+
+# bcrypt gets its own bounded pool so a login burst can't starve the default executor
+_PASSWORD_WORKERS = os.cpu_count() or 4
+_password_pool = ThreadPoolExecutor(max_workers=_PASSWORD_WORKERS, thread_name_prefix="bcrypt")
+# One slot per worker, taken before submitting: a running bcrypt call can't be cancelled,
+# so callers time out while waiting for a slot, never after their hash has started
+_password_slots = asyncio.Semaphore(_PASSWORD_WORKERS)
+
+
+async def _run_kdf(fn, *args):
+    """Run a bcrypt call on the password pool; fail fast if no worker frees up within the timeout."""
+    try:
+        await asyncio.wait_for(_password_slots.acquire(), timeout=PASSWORD_KDF_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        logger.warning("Password hashing timed out; pool saturated")
+        Exceptions.service_unavailable("Too many sign-in attempts in progress, try again shortly")
+    try:
+        return await asyncio.get_running_loop().run_in_executor(_password_pool, fn, *args)
+    finally:
+        _password_slots.release()
+
+
+@lru_cache(maxsize=1024)
+def _decode_token_cached(token: str, _window: int) -> dict:
+    """Verify and decode a JWT; cached per token within a short time window."""
+    return jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+
+
 class SecurityManager:
     """Handles authentication, password hashing, and role-based authorization."""
 
     # ----- PASSWORD -----
     @staticmethod
-    def hash_password(password: str) -> str:
-        return pwd_context.hash(password)
+    async def hash_password(password: str) -> str:
+        """bcrypt hash, run on the password pool so the KDF doesn't block the event loop."""
+        return await _run_kdf(pwd_context.hash, password)
 
     @staticmethod
-    def verify_password(plain_password: str, hashed_password: str) -> bool:
-        return pwd_context.verify(plain_password, hashed_password)
+    async def verify_password(plain_password: str, hashed_password: str) -> bool:
+        """bcrypt verify on the password pool so the KDF doesn't block the event loop."""
+        return await _run_kdf(pwd_context.verify, plain_password, hashed_password)
 
     @staticmethod
     def constant_time_compare(val1: str, val2: str) -> bool:
@@ -45,6 +83,19 @@ class SecurityManager:
 
         return token
 
+    @staticmethod
+    def decode_token(token: str) -> dict:
+        """
+        Decode a JWT, reusing the verified payload for repeat requests with the same token.
+
+        Expiry is re-checked on every call since a cached payload can outlive its exp.
+        """
+        payload = _decode_token_cached(token, int(time.time() // TOKEN_DECODE_CACHE_SECONDS))
+        exp = payload.get("exp")
+        if exp is not None and exp <= time.time():
+            raise ExpiredSignatureError("Signature has expired.")
+        return payload
+
     # ----- CURRENT USER -----
     @staticmethod
     async def get_current_user(
@@ -67,7 +118,7 @@ class SecurityManager:
 
         try:
 
-            payload = jwt.decode(token, settings.JWT_SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+            payload = SecurityManager.decode_token(token)
             user_id_raw = payload.get("sub")
             if user_id_raw is None:
                 print("No user ID found in JWT payload")
@@ -109,10 +160,12 @@ class SecurityManager:
 
     # ----- ROLE CHECKS -----
     def require_role_dep(self, allowed_roles: list[UserRole]):
+        allowed = frozenset(allowed_roles)
+
         async def _dep(
                 current_user: User = Depends(self.current_user_dep())
         ) -> User:
-            if current_user.role not in allowed_roles:
+            if current_user.role not in allowed:
                 raise Exceptions.permission_denied()
             return current_user
 
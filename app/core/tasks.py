@@ -0,0 +1,48 @@
+import asyncio
+import logging
+
+from app.core.cache import cache, safe_hincr
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.crud.product_crud import product_crud
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_VIEWS_KEY = "product:views"
+
+
+async def record_product_view(product_id: int) -> None:
+    """Buffer a product view; flush_product_views writes the totals to the database."""
+    await safe_hincr(PRODUCT_VIEWS_KEY, str(product_id))
+
+
+async def flush_product_views() -> None:
+    """Move buffered view counts into products.view_count; counts go back to the buffer if the write fails."""
+    counts = await cache.hpop_all(PRODUCT_VIEWS_KEY)
+    if not counts:
+        return
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await product_crud.apply_view_counts(db, counts)
+    except Exception:
+        # Merged into whatever was buffered meanwhile, so the next flush retries them
+        for product_id, delta in counts.items():
+            await safe_hincr(PRODUCT_VIEWS_KEY, product_id, delta)
+        raise
+
+
+async def run_view_count_flusher() -> None:
+    """Flush buffered product views every VIEW_COUNT_FLUSH_SECONDS until cancelled."""
+    try:
+        while True:
+            await asyncio.sleep(settings.VIEW_COUNT_FLUSH_SECONDS)
+            try:
+                await flush_product_views()
+            except Exception as e:
+                logger.error(f"Failed to flush product view counts: {e}")
+    finally:
+        try:
+            await flush_product_views()
+        except Exception as e:
+            logger.error(f"Failed to flush product view counts on shutdown: {e}")
@@ -0,0 +1,88 @@
+import time
+import zlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Optional
+
+from fastapi import Request, Response, status
+
+from app.core.cache import cache, safe_get, safe_set
+
+VERSION_KEY_PREFIX = "version:"
+# Without a shared cache each worker keeps its own versions and never sees another
+# worker's bump; expiring them bounds how long that worker can keep answering 304.
+LOCAL_VERSION_TTL = 30
+
+
+def _version_ttl() -> Optional[int]:
+    return None if cache.shared else LOCAL_VERSION_TTL
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from the given version parts."""
+    return 'W/"' + "-".join(str(part) for part in parts) + '"'
+
+
+def query_fingerprint(request: Request) -> int:
+    """Stable (cross-process) checksum of the query string, for list ETags."""
+    return zlib.crc32(str(request.url.query).encode())
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check the request's If-None-Match header against an ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {value.strip() for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def http_date(moment: datetime) -> str:
+    """Format a timestamp for the Last-Modified header."""
+    return format_datetime(moment.astimezone(timezone.utc), usegmt=True)
+
+
+def unmodified_since(request: Request, last_modified: datetime) -> bool:
+    """
+    Check the request's If-Modified-Since header against a resource timestamp.
+
+    Ignored when If-None-Match is present or the date does not parse; compared at
+    second precision since that is all an HTTP date carries.
+    """
+    header = request.headers.get("if-modified-since")
+    if not header or "if-none-match" in request.headers:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+
+def not_modified(etag: str) -> Response:
+    """Empty 304 response carrying the current ETag."""
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+
+async def get_version(name: str) -> int:
+    """
+    Current version of a collection (e.g. "products"), used in list ETags.
+
+    Versions are timestamps rather than counters so a version lost from the cache
+    never comes back as a value a client may already hold. If the cache is unreachable the fresh timestamp is never
+    stored, so the version (and every ETag built on it) is new on each request.
+    """
+    key = f"{VERSION_KEY_PREFIX}{name}"
+    raw = await safe_get(key)
+    if raw is None:
+        version = time.time_ns()
+        await safe_set(key, str(version).encode(), _version_ttl())
+        return version
+    return int(raw)
+
+
+async def bump_version(name: str) -> None:
+    """Mark a collection as changed so list ETags stop matching."""
+    await safe_set(f"{VERSION_KEY_PREFIX}{name}", str(time.time_ns()).encode(), _version_ttl())
@@ -83,7 +83,7 @@ class VerificationManager:
         """Generate and store verification code"""
         for attempt in range(max_retries):
             try:
-                code = ''.join(secrets.choice(string.digits) for _ in range(code_length))
+                code = f"{secrets.randbelow(10 ** code_length):0{code_length}d}"
                 expires_at = datetime.now(timezone.utc) + timedelta(minutes=expiry_minutes)
 
                 # Upsert pattern
@@ -1,4 +1,5 @@
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from types import MappingProxyType
 from uuid import UUID
 from fastapi import status
@@ -60,13 +61,25 @@ def create_json_response(content: Any, status_code: int = 200) -> JSONResponse:
     """
     Create a JSONResponse with proper serialization handling.
     """
-    # Serialize the content using our custom function
-    serialized_content = serialize_value(content)
+    # serialize_value already reduces enums, datetimes, UUIDs, models and ORM objects to
+    # JSON types, so the content goes straight to JSONResponse without a dumps/loads round trip
+    return JSONResponse(status_code=status_code, content=serialize_value(content))
 
-    # Use custom JSON encoder for additional safety
-    json_content = json.loads(json.dumps(serialized_content, cls=CustomJSONEncoder))
 
-    return JSONResponse(status_code=status_code, content=json_content)
+class _RenderedJSONResponse(JSONResponse):
+    """JSONResponse whose content is already-encoded JSON bytes."""
+
+    def render(self, content: bytes) -> bytes:
+        return content
+
+
+@lru_cache(maxsize=256)
+def _static_body(detail: str, status_code: int) -> bytes:
+    """Encoded {status_code, detail, data: null} body, built once per (detail, status)."""
+    return json.dumps(
+        {"status_code": status_code, "detail": detail, "data": None},
+        separators=(",", ":")
+    ).encode()
 
 
 def set_token_cookie(response: JSONResponse, token: str, token_type: str, expires_in: int) -> JSONResponse:
@@ -102,8 +115,11 @@ class Success:
             **kwargs
     ) -> JSONResponse:
         """Base method for all success responses with proper serialization"""
+        if not kwargs:
+            return _RenderedJSONResponse(_static_body(detail, status_code), status_code=status_code)
+
         # Serialize all data before creating response
-        data = serialize_value(kwargs) if kwargs else None
+        data = serialize_value(kwargs)
         content = {
             "status_code": status_code,
             "detail": detail,
@@ -164,6 +180,10 @@ class Success:
         """
 
 
+        # Dump pydantic users in one pydantic-core pass instead of walking them field by field
+        if hasattr(user, "model_dump"):
+            user = user.model_dump(mode="json")
+
         # Create base response with all token info
         response = Success.ok(
             "Login successful",
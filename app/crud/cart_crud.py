@@ -1,18 +1,120 @@
-from .crud_base import CrudBase
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from .crud_base import CrudBase, atomic
+from .product_crud import product_crud
 from ..models.cart import Cart, CartItem
+from ..models.product import ProductStatus
 
 
 class CartCrud(CrudBase[Cart]):
     def __init__(self):
         super().__init__(Cart)
 
+    async def get_or_create_cart(self, db: AsyncSession, user_id: int) -> Cart:
+        """Get the user's cart, creating an empty one on first use."""
+        cart = await self.get(db, filters={"user_id": user_id})
+        if cart is None:
+            cart = await self.create(db, user_id=user_id, total_amount=0.0)
+        return cart
+
+    async def get_cart_with_items(self, db: AsyncSession, user_id: int) -> Cart:
+        """
+        Get the user's cart with items and their products loaded up front.
+
+        Async sessions can't lazy-load, so the route must not touch cart.items unloaded.
+        """
+
+        async def _op():
+            stmt = (
+                select(Cart)
+                .options(selectinload(Cart.items).selectinload(CartItem.product))
+                .where(Cart.user_id == user_id)
+            )
+            return (await db.execute(stmt)).scalar_one_or_none()
+
+        cart = await self._execute_read_operation(db, "get_cart_with_items", _op)
+        if cart is None:
+            await self.create(db, user_id=user_id, total_amount=0.0)
+            cart = await self._execute_read_operation(db, "get_cart_with_items", _op)
+        return cart
+
+    async def compute_total(self, db: AsyncSession, cart_id: int) -> float:
+        """Sum of the cart's line totals, computed in SQL."""
+
+        async def _op():
+            stmt = select(func.coalesce(func.sum(CartItem.quantity * CartItem.unit_price), 0.0)).where(
+                CartItem.cart_id == cart_id
+            )
+            return float((await db.execute(stmt)).scalar_one())
+
+        return await self._execute_read_operation(db, "compute_total", _op)
 
+    async def refresh_total(self, db: AsyncSession, cart: Cart) -> Cart:
+        """Recompute cart.total_amount from its items."""
+        return await self.update(db, db_obj=cart, total_amount=await self.compute_total(db, cart.id))
+
+    async def add_to_cart(self, db: AsyncSession, user_id: int, product_id: int, quantity: int) -> CartItem:
+        """
+        Add a product to the user's cart, or bump its quantity if already there.
+
+        Status and stock are checked against the cached product snapshot, so a
+        cache hit costs no product query.
+        """
+        snapshot = await product_crud.get_snapshot(db, product_id)
+        if snapshot is None or snapshot["status"] != ProductStatus.ACTIVE.value or snapshot["price"] is None:
+            raise ValueError("Product is not available")
+
+        async with atomic(db):
+            cart = await self.get_or_create_cart(db, user_id)
+            item = await cart_item_crud.get(db, filters={"cart_id": cart.id, "product_id": product_id})
+            new_quantity = quantity + (item.quantity if item else 0)
+            if new_quantity > snapshot["stock_quantity"]:
+                raise ValueError("Insufficient stock")
+
+            unit_price = snapshot["price"]
+            if item is None:
+                item = await cart_item_crud.create(
+                    db,
+                    cart_id=cart.id,
+                    product_id=product_id,
+                    quantity=new_quantity,
+                    unit_price=unit_price,
+                    total_price=unit_price * new_quantity
+                )
+            else:
+                item = await cart_item_crud.update(
+                    db, db_obj=item, quantity=new_quantity, unit_price=unit_price, total_price=unit_price * new_quantity
+                )
+
+            await self.refresh_total(db, cart)
+        await db.refresh(item, ["product"])
+        return item
 
 
 class CartItemCrud(CrudBase[CartItem]):
     def __init__(self):
         super().__init__(CartItem)
 
+    async def update_cart_item(self, db: AsyncSession, user_id: int, item_id: int, quantity: int) -> CartItem:
+        """Set the quantity of an item in the user's cart, checked against the cached product snapshot."""
+        cart = await cart_crud.get(db, filters={"user_id": user_id})
+        item = await self.get(db, obj_id=item_id, filters={"cart_id": cart.id}) if cart else None
+        if item is None:
+            raise ValueError("Cart item not found")
+
+        snapshot = await product_crud.get_snapshot(db, item.product_id)
+        if snapshot is None or snapshot["status"] != ProductStatus.ACTIVE.value:
+            raise ValueError("Product is not available")
+        if quantity > snapshot["stock_quantity"]:
+            raise ValueError("Insufficient stock")
+
+        async with atomic(db):
+            item = await self.update(db, db_obj=item, quantity=quantity, total_price=item.unit_price * quantity)
+            await cart_crud.refresh_total(db, cart)
+        await db.refresh(item, ["product"])
+        return item
 
 
 # Create instances
@@ -369,4 +369,8 @@ class SubCategoryService(CrudBase[SubCategory]):
             filters={**filters, "is_active": True}
         )
 
-        return stats
\ No newline at end of file
+        return stats
+
+
+category_crud = CategoryService()
+subcategory_crud = SubCategoryService()
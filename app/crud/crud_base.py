@@ -1,5 +1,5 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, func, update, delete
+from sqlalchemy import select, insert, and_, func, update, delete, tuple_
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from typing import (
     Generic,
@@ -14,11 +14,40 @@ from typing import (
     Tuple,
 )
 import logging
+from contextlib import asynccontextmanager
 from sqlalchemy.orm import load_only as sqlalchemy_load_only
 
+from app.core.utils.pagination import encode_cursor, decode_cursor
+
 ModelType = TypeVar('ModelType')
 logger = logging.getLogger(__name__)
 
+# Session.info flag set while CrudBase.atomic() is active
+_ATOMIC_KEY = "crud_atomic"
+
+
+@asynccontextmanager
+async def atomic(db: AsyncSession):
+    """
+    Run several crud writes as one transaction.
+
+    Writes inside the block flush instead of committing; the block commits once
+    at the end or rolls everything back on error. Nested blocks join the outer one.
+    """
+    if db.info.get(_ATOMIC_KEY):
+        yield db
+        return
+
+    db.info[_ATOMIC_KEY] = True
+    try:
+        yield db
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        raise
+    finally:
+        db.info.pop(_ATOMIC_KEY, None)
+
 
 class CrudBase(Generic[ModelType]):
     def __init__(self, model: Type[ModelType]):
@@ -101,6 +130,13 @@ class CrudBase(Generic[ModelType]):
             stmt = stmt.options(sqlalchemy_load_only(*load_only))
         return stmt
 
+    @staticmethod
+    def _apply_options(stmt, options: Optional[List[Any]] = None):
+        """Apply loader options (selectinload, joinedload, raiseload...) to statement."""
+        if options:
+            stmt = stmt.options(*options)
+        return stmt
+
     def _apply_filters(self, stmt, filters: Optional[Dict[str, Any]] = None, **kwargs):
         """Apply filter conditions to statement."""
         conditions = self._build_filters(filters, **kwargs)
@@ -130,12 +166,32 @@ class CrudBase(Generic[ModelType]):
         """Apply pagination to statement."""
         return stmt.offset(skip).limit(limit)
 
+    def _apply_keyset(self, stmt, cursor: Optional[str] = None, limit: int = 100):
+        """Apply (created_at, id) keyset pagination, fetching one extra row to detect a next page."""
+        position = decode_cursor(cursor)
+        if position is not None:
+            stmt = stmt.where(tuple_(self.model.created_at, self.model.id) < position)
+        return stmt.order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit + 1)
+
+    @staticmethod
+    def _split_keyset_page(rows: Sequence[Any], limit: int, key=lambda row: row) -> Tuple[Sequence[Any], Optional[str]]:
+        """Trim the extra keyset row and build the next cursor from the last item."""
+        if len(rows) <= limit:
+            return rows, None
+
+        rows = rows[:limit]
+        last = key(rows[-1])
+        return rows, encode_cursor(last.created_at, last.id)
+
     @staticmethod
     async def _execute_write_operation(db: AsyncSession, operation_name: str, db_operation):
-        """Execute a database write operation with error handling and commit."""
+        """Execute a database write operation with error handling and commit (deferred inside atomic())."""
         try:
             result = await db_operation()
-            await db.commit()
+            if db.info.get(_ATOMIC_KEY):
+                await db.flush()
+            else:
+                await db.commit()
             return result
         except IntegrityError as e:
             await db.rollback()
@@ -178,15 +234,14 @@ class CrudBase(Generic[ModelType]):
         return await self._execute_write_operation(db, "create", _op)
 
     async def bulk_create(self, db: AsyncSession, objects: List[Dict[str, Any]]) -> List[ModelType]:
-        """Bulk create records"""
+        """Bulk create records with one executemany INSERT ... RETURNING, in input order"""
+        if not objects:
+            return []
 
         async def _op():
-            db_objects = [self.model(**obj) for obj in objects]
-            db.add_all(db_objects)
-            await db.flush()
-            for db_obj in db_objects:
-                await db.refresh(db_obj)
-            return db_objects
+            stmt = insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            result = await db.scalars(stmt, objects)
+            return list(result.all())
 
         return await self._execute_write_operation(db, "bulk_create", _op)
 
@@ -244,6 +299,7 @@ class CrudBase(Generic[ModelType]):
             order_by: Optional[Any] = None,
             load_only: Optional[List[str]] = None,
             where_clause: Optional[Any] = None,
+            options: Optional[List[Any]] = None,
             **kwargs: Any
     ) -> Sequence[ModelType]:
         """Get multiple records with pagination"""
@@ -251,6 +307,7 @@ class CrudBase(Generic[ModelType]):
         async def _op():
             stmt = select(self.model)
             stmt = self._apply_load_only(stmt, load_only)
+            stmt = self._apply_options(stmt, options)
             stmt = self._apply_filters(stmt, filters, **kwargs)
             stmt = self._apply_where_clause(stmt, where_clause)
             stmt = self._apply_order_by(stmt, order_by)
@@ -261,6 +318,36 @@ class CrudBase(Generic[ModelType]):
 
         return await self._execute_read_operation(db, "get_multi", _op)
 
+    async def get_multi_after(
+            self,
+            db: AsyncSession,
+            *,
+            cursor: Optional[str] = None,
+            limit: int = 100,
+            filters: Optional[Dict[str, Any]] = None,
+            where_clause: Optional[Any] = None,
+            options: Optional[List[Any]] = None,
+            **kwargs: Any
+    ) -> Tuple[Sequence[ModelType], Optional[str]]:
+        """
+        Get multiple records with keyset pagination on (created_at, id), newest first.
+
+        Returns the page and the cursor for the next page (None on the last page).
+        One extra row is fetched to detect a following page, so no COUNT is issued.
+        """
+
+        async def _op():
+            stmt = select(self.model)
+            stmt = self._apply_options(stmt, options)
+            stmt = self._apply_filters(stmt, filters, **kwargs)
+            stmt = self._apply_where_clause(stmt, where_clause)
+            stmt = self._apply_keyset(stmt, cursor, limit)
+
+            result = await db.execute(stmt)
+            return self._split_keyset_page(result.scalars().all(), limit)
+
+        return await self._execute_read_operation(db, "get_multi_after", _op)
+
     # UPDATE Operations
     async def update(
             self,
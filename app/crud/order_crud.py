@@ -1,3 +1,8 @@
+from typing import Optional, Sequence, Tuple, List
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from .crud_base import CrudBase
 from ..models.order import Order, OrderItem, OrderStatus
 
@@ -6,6 +11,57 @@ class OrderCrud(CrudBase[Order]):
     def __init__(self):
         super().__init__(Order)
 
+    @staticmethod
+    def _items_count_column():
+        """Correlated COUNT of order items, so list views never load Order.items."""
+        return (
+            select(func.count(OrderItem.id))
+            .where(OrderItem.order_id == Order.id)
+            .correlate(Order)
+            .scalar_subquery()
+            .label("items_count")
+        )
+
+    async def get_user_orders(
+            self,
+            db: AsyncSession,
+            user_id: int,
+            cursor: Optional[str] = None,
+            limit: int = 20
+    ) -> Tuple[List[Tuple[Order, int]], Optional[str]]:
+        """Get a user's orders with their item counts, newest first."""
+
+        async def _op():
+            stmt = select(Order, self._items_count_column()).where(Order.user_id == user_id)
+            stmt = self._apply_keyset(stmt, cursor, limit)
+
+            result = await db.execute(stmt)
+            rows = [tuple(row) for row in result.all()]
+            return self._split_keyset_page(rows, limit, key=lambda row: row[0])
+
+        return await self._execute_read_operation(db, "get_user_orders", _op)
+
+    async def get_orders_by_status(
+            self,
+            db: AsyncSession,
+            status: OrderStatus,
+            skip: int = 0,
+            limit: int = 20
+    ) -> List[Tuple[Order, int]]:
+        """Get orders in a given status with their item counts, newest first."""
+
+        async def _op():
+            stmt = (
+                select(Order, self._items_count_column())
+                .where(Order.status == status)
+                .order_by(Order.created_at.desc())
+            )
+            stmt = self._apply_pagination(stmt, skip, limit)
+
+            result = await db.execute(stmt)
+            return [tuple(row) for row in result.all()]
+
+        return await self._execute_read_operation(db, "get_orders_by_status", _op)
 
 
 class OrderItemCrud(CrudBase[OrderItem]):
@@ -2,12 +2,38 @@ import json
 
 from app.models import (
     Product, ProductAttribute, ProductAttributeValue,
-    ProductVariant, ProductVariantAttribute, ProductStatus, ProductImage
+    ProductVariant, ProductVariantAttribute, ProductStatus, ProductImage, Shop
 )
+from app.core.cache import cache, dump_json, safe_get_many, safe_set_many
 from app.crud.crud_base import CrudBase
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, update, or_
-from typing import List, Optional, Any, Coroutine, Sequence, Dict
+from sqlalchemy import select, func, and_, update, or_, bindparam, lambda_stmt
+from typing import List, Optional, Any, Coroutine, Sequence, Dict, Tuple
+
+
+# Built once; SQLAlchemy caches the compiled SQL for lambda statements across calls
+_GET_PRODUCT_STMT = lambda_stmt(lambda: select(Product).where(Product.id == bindparam("product_id")))
+
+PRODUCT_SNAPSHOT_CACHE_PREFIX = "product:"
+PRODUCT_SNAPSHOT_CACHE_TTL = 60
+
+# Only the columns the cart/order checks need, so cached values stay a few hundred bytes
+_PRODUCT_SNAPSHOT_STMT = lambda_stmt(
+    lambda: select(
+        Product.id,
+        Product.shop_id,
+        Product.status,
+        Shop.latitude,
+        Shop.longitude,
+        func.coalesce(func.sum(ProductVariant.stock_quantity), 0).label("stock_quantity"),
+        func.min(ProductVariant.price).label("price"),
+        func.max(ProductVariant.weight).label("weight_kg")
+    )
+    .join(Shop, Shop.id == Product.shop_id)
+    .outerjoin(ProductVariant, ProductVariant.product_id == Product.id)
+    .where(Product.id.in_(bindparam("product_ids", expanding=True)))
+    .group_by(Product.id, Shop.id)
+)
 
 
 class ProductService(CrudBase[Product]):
@@ -16,6 +42,64 @@ class ProductService(CrudBase[Product]):
     def __init__(self):
         super().__init__(Product)
 
+    async def get_product(self, db: AsyncSession, product_id: int) -> Optional[Product]:
+        """Get a product by id using the precompiled statement."""
+
+        async def _op():
+            result = await db.execute(_GET_PRODUCT_STMT, {"product_id": product_id})
+            return result.scalar_one_or_none()
+
+        return await self._execute_read_operation(db, "get_product", _op)
+
+    async def get_snapshot(self, db: AsyncSession, product_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Status, stock, price and shop location of a product, cached for PRODUCT_SNAPSHOT_CACHE_TTL.
+
+        Used by the cart hot path instead of loading the full ORM product.
+        """
+        return (await self.get_snapshots(db, [product_id])).get(product_id)
+
+    async def get_snapshots(self, db: AsyncSession, product_ids: List[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Snapshots for several products: one MGET, then one query for whatever missed.
+
+        Products that don't exist are absent from the result.
+        """
+        product_ids = list(dict.fromkeys(product_ids))
+        cached = await safe_get_many([f"{PRODUCT_SNAPSHOT_CACHE_PREFIX}{pid}" for pid in product_ids])
+        snapshots = {pid: json.loads(raw) for pid, raw in zip(product_ids, cached) if raw is not None}
+        missing = [pid for pid in product_ids if pid not in snapshots]
+        if not missing:
+            return snapshots
+
+        async def _op():
+            result = await db.execute(_PRODUCT_SNAPSHOT_STMT, {"product_ids": missing})
+            return result.mappings().all()
+
+        loaded = {}
+        for row in await self._execute_read_operation(db, "get_snapshots", _op):
+            loaded[row["id"]] = {
+                "id": row["id"],
+                "shop_id": row["shop_id"],
+                "status": row["status"].value,
+                "stock_quantity": int(row["stock_quantity"]),
+                "price": row["price"],
+                "weight_kg": row["weight_kg"],
+                "shop_latitude": row["latitude"],
+                "shop_longitude": row["longitude"]
+            }
+        await safe_set_many(
+            {f"{PRODUCT_SNAPSHOT_CACHE_PREFIX}{pid}": dump_json(snapshot) for pid, snapshot in loaded.items()},
+            PRODUCT_SNAPSHOT_CACHE_TTL
+        )
+        snapshots.update(loaded)
+        return snapshots
+
+    @staticmethod
+    async def invalidate_snapshot(product_id: int) -> None:
+        """Drop the cached snapshot after the product or its variants change."""
+        await cache.delete(f"{PRODUCT_SNAPSHOT_CACHE_PREFIX}{product_id}")
+
     async def create_product(
             self,
             db: AsyncSession,
@@ -35,7 +119,7 @@ class ProductService(CrudBase[Product]):
             "category_id": category_id,
             "name": name,
             "description": description,
-            "tags": json.dumps(tags) if tags else None,
+            "tags": tags or None,
             "status": status,
             "is_featured": is_featured
         }
@@ -71,20 +155,19 @@ class ProductService(CrudBase[Product]):
             db: AsyncSession,
             merchant_id: int,
             status: Optional[ProductStatus] = None,
-            skip: int = 0,
+            cursor: Optional[str] = None,
             limit: int = 100
-    ) -> Sequence[Product]:
-        """Get all products for a merchant across all shops."""
+    ) -> Tuple[Sequence[Product], Optional[str]]:
+        """Get all products for a merchant across all shops, newest first."""
         filters = {"merchant_id": merchant_id}
         if status:
             filters["status"] = status
 
-        return await self.get_multi(
+        return await self.get_multi_after(
             db,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
-            filters=filters,
-            order_by=["shop_id", "name"]
+            filters=filters
         )
 
     async def get_product_with_details(
@@ -95,9 +178,11 @@ class ProductService(CrudBase[Product]):
         """Get product with all related details."""
         from sqlalchemy.orm import joinedload, selectinload
 
+        # Many-to-one parents are joined; collections use selectinload so sibling
+        # collections (images x variants x attributes) never multiply rows in one JOIN
         stmt = select(Product).options(
             joinedload(Product.shop),
-            joinedload(Product.category),
+            joinedload(Product.subcategory),
             joinedload(Product.merchant),
             selectinload(Product.images),
             selectinload(Product.variants).selectinload(ProductVariant.attributes),
@@ -105,7 +190,7 @@ class ProductService(CrudBase[Product]):
         ).where(Product.id == product_id)
 
         result = await db.execute(stmt)
-        return result.unique().scalar_one_or_none()
+        return result.scalar_one_or_none()
 
     async def update_product_status(
             self,
@@ -121,6 +206,14 @@ class ProductService(CrudBase[Product]):
 
         return await self.update(db, obj_id=product_id, status=new_status)
 
+    async def touch(self, db: AsyncSession, product_id: int) -> None:
+        """Bump a product's updated_at after its images or variants change, so its detail ETag moves."""
+
+        async def _op():
+            await db.execute(update(Product).where(Product.id == product_id).values(updated_at=func.now()))
+
+        await self._execute_write_operation(db, "touch", _op)
+
     async def toggle_featured_status(
             self,
             db: AsyncSession,
@@ -147,6 +240,27 @@ class ProductService(CrudBase[Product]):
             update_values={"view_count": Product.view_count + 1}
         )
 
+    async def apply_view_counts(
+            self,
+            db: AsyncSession,
+            counts: Dict[str, int]
+    ) -> None:
+        """Add buffered view counts ({product_id: delta}) in a single executemany UPDATE."""
+        if not counts:
+            return
+
+        table = Product.__table__
+
+        async def _op():
+            await db.execute(
+                update(table)
+                .where(table.c.id == bindparam("product_id"))
+                .values(view_count=table.c.view_count + bindparam("delta")),
+                [{"product_id": int(pid), "delta": delta} for pid, delta in counts.items()]
+            )
+
+        await self._execute_write_operation(db, "apply_view_counts", _op)
+
     async def search_products(
             self,
             db: AsyncSession,
@@ -157,10 +271,10 @@ class ProductService(CrudBase[Product]):
             max_price: Optional[float] = None,
             status: ProductStatus = ProductStatus.ACTIVE,
             featured_only: bool = False,
-            skip: int = 0,
+            cursor: Optional[str] = None,
             limit: int = 100
-    ) -> Sequence[Product]:
-        """Search products with various filters."""
+    ) -> Tuple[Sequence[Product], Optional[str]]:
+        """Search products with various filters, newest first."""
         conditions = [Product.status == status]
 
         if category_id:
@@ -173,9 +287,8 @@ class ProductService(CrudBase[Product]):
         # Text search
         if search_term:
             search_condition = or_(
-                Product.name.ilike(f"%{search_term}%"),
-                Product.description.ilike(f"%{search_term}%"),
-                Product.tags.ilike(f"%{search_term}%")
+                Product.search_vector.op("@@")(func.plainto_tsquery("english", search_term)),
+                Product.tags.contains([search_term])
             )
             conditions.append(search_condition)
 
@@ -193,12 +306,11 @@ class ProductService(CrudBase[Product]):
 
         where_clause = and_(*conditions)
 
-        return await self.get_multi(
+        return await self.get_multi_after(
             db,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
-            where_clause=where_clause,
-            order_by=["-is_featured", "-view_count", "name"]
+            where_clause=where_clause
         )
 
     async def get_featured_products(
@@ -376,6 +488,8 @@ class ProductVariantAttributeCrud(CrudBase[ProductVariantAttribute]):
 
 # Instantiate crud objects
 
+product_crud = ProductService()
+
 attribute_crud = ProductAttributeCrud()
 attribute_value_crud = ProductAttributeValueCrud()
 variant_crud = ProductVariantCrud()
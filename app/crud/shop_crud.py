@@ -1,18 +1,80 @@
-from math import cos
+from math import asin, cos, radians, sin, sqrt
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import and_, or_, select
-from typing import Optional, List, Dict, Any, Sequence
+from sqlalchemy import or_, select, func, lambda_stmt, bindparam
+from sqlalchemy.orm import raiseload
+from typing import Optional, List, Dict, Any, Sequence, Tuple
 from .crud_base import CrudBase
 from app.models import Shop
 
 
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points, the Python twin of ShopCrud._distance_km."""
+    d_lat = radians(lat2 - lat1) / 2
+    d_lng = radians(lng2 - lng1) / 2
+    a = sin(d_lat) ** 2 + cos(radians(lat1)) * cos(radians(lat2)) * sin(d_lng) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(min(1.0, sqrt(a)))
+
+
+# ShopResponse needs no relationships; fail loudly instead of lazy-loading one per row
+SHOP_LIST_OPTIONS = [raiseload("*")]
+
+# search_shops filters, written against bind parameters so each filter combination compiles once
+_SEARCH_TERM_FILTER = or_(
+    Shop.name.ilike(bindparam("term")),
+    Shop.description.ilike(bindparam("term")),
+    Shop.address.ilike(bindparam("term"))
+)
+_SEARCH_DISTANCE_KM = 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(
+    func.power(func.sin(func.radians(Shop.latitude - bindparam("lat")) / 2), 2)
+    + func.cos(func.radians(bindparam("lat"))) * func.cos(func.radians(Shop.latitude))
+    * func.power(func.sin(func.radians(Shop.longitude - bindparam("lng")) / 2), 2)
+)))
+_SEARCH_RADIUS_FILTER = [
+    Shop.latitude.between(bindparam("lat_min"), bindparam("lat_max")),
+    Shop.longitude.between(bindparam("lng_min"), bindparam("lng_max")),
+    _SEARCH_DISTANCE_KM <= bindparam("radius_km")
+]
+
+
 class ShopCrud(CrudBase[Shop]):
     """Service for handling shop operations."""
 
     def __init__(self):
         super().__init__(Shop)
 
+    @staticmethod
+    def _bounding_box_limits(
+            latitude: float, longitude: float, radius_km: float
+    ) -> Tuple[Tuple[float, float], Tuple[float, float]]:
+        """(lat_min, lat_max), (lng_min, lng_max) of a box containing the search circle."""
+        lat_range = radius_km / 111.0  # ~111km per degree of latitude
+        lng_range = radius_km / (111.0 * max(abs(cos(radians(latitude))), 0.01))
+        return (latitude - lat_range, latitude + lat_range), (longitude - lng_range, longitude + lng_range)
+
+    @classmethod
+    def _bounding_box(cls, latitude: float, longitude: float, radius_km: float) -> List[Any]:
+        """Index-friendly lat/lng range that contains the search circle."""
+        (lat_min, lat_max), (lng_min, lng_max) = cls._bounding_box_limits(latitude, longitude, radius_km)
+        return [
+            Shop.latitude.between(lat_min, lat_max),
+            Shop.longitude.between(lng_min, lng_max)
+        ]
+
+    @staticmethod
+    def _distance_km(latitude: float, longitude: float):
+        """Haversine great-circle distance from a point to each shop, evaluated in SQL."""
+        d_lat = func.radians(Shop.latitude - latitude) / 2
+        d_lng = func.radians(Shop.longitude - longitude) / 2
+        a = (
+            func.power(func.sin(d_lat), 2)
+            + cos(radians(latitude)) * func.cos(func.radians(Shop.latitude)) * func.power(func.sin(d_lng), 2)
+        )
+        return 2 * EARTH_RADIUS_KM * func.asin(func.least(1.0, func.sqrt(a)))
+
     async def create_shop(
             self,
             db: AsyncSession,
@@ -45,20 +107,20 @@ class ShopCrud(CrudBase[Shop]):
             db: AsyncSession,
             merchant_id: int,
             active_only: bool = True,
-            skip: int = 0,
+            cursor: Optional[str] = None,
             limit: int = 100
-    ) -> Sequence[Shop]:
-        """Get all shops for a specific merchant."""
+    ) -> Tuple[Sequence[Shop], Optional[str]]:
+        """Get all shops for a specific merchant, newest first."""
         filters = {"merchant_id": merchant_id}
         if active_only:
             filters["is_active"] = True
 
-        return await self.get_multi(
+        return await self.get_multi_after(
             db,
-            skip=skip,
+            cursor=cursor,
             limit=limit,
             filters=filters,
-            order_by="name"
+            options=SHOP_LIST_OPTIONS
         )
 
     async def get_shop_with_merchant(
@@ -88,7 +150,7 @@ class ShopCrud(CrudBase[Shop]):
         if not shop or shop.merchant_id != merchant_id:
             return None
 
-        return await self.update(db, obj_id=shop_id, **update_data)
+        return await self.update(db, db_obj=shop, **update_data)
 
     async def toggle_shop_status(
             self,
@@ -102,7 +164,7 @@ class ShopCrud(CrudBase[Shop]):
             return None
 
         new_status = not shop.is_active
-        return await self.update(db, obj_id=shop_id, is_active=new_status)
+        return await self.update(db, db_obj=shop, is_active=new_status)
 
     async def search_shops(
             self,
@@ -114,43 +176,45 @@ class ShopCrud(CrudBase[Shop]):
             active_only: bool = True,
             skip: int = 0,
             limit: int = 100
-    ) -> Sequence[Shop]:
-        """Search shops with location-based filtering."""
-        conditions = []
-
-        if active_only:
-            conditions.append(Shop.is_active == True)
-
-        # Text search
+    ) -> Tuple[Sequence[Shop], int]:
+        """Search shops with location-based filtering; returns the page and total matches."""
+        params: Dict[str, Any] = {}
         if search_term:
-            search_condition = or_(
-                Shop.name.ilike(f"%{search_term}%"),
-                Shop.description.ilike(f"%{search_term}%"),
-                Shop.address.ilike(f"%{search_term}%")
+            params["term"] = f"%{search_term}%"
+        has_location = latitude is not None and longitude is not None
+        if has_location:
+            (lat_min, lat_max), (lng_min, lng_max) = self._bounding_box_limits(latitude, longitude, radius_km)
+            params.update(
+                lat=latitude, lng=longitude, radius_km=radius_km,
+                lat_min=lat_min, lat_max=lat_max, lng_min=lng_min, lng_max=lng_max
             )
-            conditions.append(search_condition)
 
-        # Location-based search (approximate)
-        if latitude and longitude:
-            # Simple bounding box for demonstration
-            # In production, use PostGIS or similar for accurate distance calculations
-            lat_range = 0.009 * radius_km  # ~1km per 0.009 degrees
-            lng_range = 0.009 * radius_km / abs(cos(latitude * 0.0174533))
+        def _filtered(stmt):
+            if active_only:
+                stmt += lambda s: s.where(Shop.is_active == True)
+            if search_term:
+                stmt += lambda s: s.where(_SEARCH_TERM_FILTER)
+            if has_location:
+                stmt += lambda s: s.where(*_SEARCH_RADIUS_FILTER)
+            return stmt
 
-            conditions.extend([
-                Shop.latitude.between(latitude - lat_range, latitude + lat_range),
-                Shop.longitude.between(longitude - lng_range, longitude + lng_range)
-            ])
+        async def _op():
+            stmt = _filtered(lambda_stmt(
+                lambda: select(Shop, func.count().over().label("total")).options(*SHOP_LIST_OPTIONS)
+            ))
+            stmt += lambda s: s.order_by(Shop.name).offset(bindparam("skip")).limit(bindparam("limit"))
 
-        where_clause = and_(*conditions) if conditions else None
+            rows = (await db.execute(stmt, {**params, "skip": skip, "limit": limit})).all()
+            if rows:
+                return [row[0] for row in rows], rows[0][1]
+            if skip == 0:
+                return [], 0
 
-        return await self.get_multi(
-            db,
-            skip=skip,
-            limit=limit,
-            where_clause=where_clause,
-            order_by="name"
-        )
+            # Past the last row the window count has nothing to ride on
+            count_stmt = _filtered(lambda_stmt(lambda: select(func.count()).select_from(Shop)))
+            return [], (await db.execute(count_stmt, params)).scalar_one()
+
+        return await self._execute_read_operation(db, "search_shops", _op)
 
     async def get_nearby_shops(
             self,
@@ -159,24 +223,27 @@ class ShopCrud(CrudBase[Shop]):
             longitude: float,
             radius_km: float = 10.0,
             limit: int = 50
-    ) -> Sequence[Shop]:
-        """Get shops near a specific location."""
-        # Simple bounding box approach
-        lat_range = 0.009 * radius_km
-        lng_range = 0.009 * radius_km / abs(cos(latitude * 0.0174533))
-
-        where_clause = and_(
-            Shop.is_active == True,
-            Shop.latitude.between(latitude - lat_range, latitude + lat_range),
-            Shop.longitude.between(longitude - lng_range, longitude + lng_range)
-        )
+    ) -> List[Tuple[Shop, float]]:
+        """Get active shops within radius_km of a location with their distance, nearest first."""
 
-        return await self.get_multi(
-            db,
-            where_clause=where_clause,
-            limit=limit,
-            order_by="name"
-        )
+        async def _op():
+            distance = self._distance_km(latitude, longitude)
+            stmt = (
+                select(Shop, distance.label("distance_km"))
+                .options(*SHOP_LIST_OPTIONS)
+                .where(
+                    Shop.is_active == True,
+                    *self._bounding_box(latitude, longitude, radius_km),
+                    distance <= radius_km
+                )
+                .order_by("distance_km")
+                .limit(limit)
+            )
+
+            result = await db.execute(stmt)
+            return [tuple(row) for row in result.all()]
+
+        return await self._execute_read_operation(db, "get_nearby_shops", _op)
 
     async def get_shop_stats(
             self,
@@ -2,12 +2,22 @@ from fastapi import FastAPI,  Request
 from fastapi.middleware.cors import CORSMiddleware
 
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
-from fastapi.responses import JSONResponse
-from contextlib import asynccontextmanager
+from fastapi.responses import JSONResponse, ORJSONResponse
+from contextlib import asynccontextmanager, suppress
+import asyncio
 import logging
 
+try:
+    import orjson  # noqa: F401
+    DefaultResponse = ORJSONResponse
+except ImportError:  # orjson is optional; fall back to stdlib json
+    DefaultResponse = JSONResponse
+
 from app.core.config import settings
 from app.core.database import init_db, close_db
+from app.core.cache import cache
+from app.core.tasks import run_view_count_flusher
+from app.core.auth_service.auth_utils import fake_password_hash
 from app.routes.api import api_router
 
 # Configure logging
@@ -22,11 +32,18 @@ async def lifespan(app: FastAPI):
     logger.info("Starting up application...")
     await init_db()
     logger.info("Database initialized")
+    await cache.connect(settings.REDIS_URL)
+    await fake_password_hash()  # Hash the unknown-email placeholder before the first login
+    view_count_flusher = asyncio.create_task(run_view_count_flusher())
 
     yield
 
     # Shutdown
     logger.info("Shutting down application...")
+    view_count_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await view_count_flusher
+    await cache.close()
     await close_db()
     logger.info("Database connections closed")
 
@@ -39,6 +56,7 @@ app = FastAPI(
     openapi_url="/api/v1/openapi.json",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=DefaultResponse,
     lifespan=lifespan
 )
 
@@ -58,7 +76,7 @@ app.include_router(api_router)
 @app.exception_handler(IntegrityError)
 async def integrity_error_handler(request: Request, exc: IntegrityError):
     logger.error(f"Integrity error on {request.url}: {exc}")
-    return JSONResponse(
+    return DefaultResponse(
         status_code=400,
         content={
             "success": False,
@@ -70,7 +88,7 @@ async def integrity_error_handler(request: Request, exc: IntegrityError):
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_error_handler(request: Request, exc: SQLAlchemyError):
     logger.error(f"Database error on {request.url}: {exc}")
-    return JSONResponse(
+    return DefaultResponse(
         status_code=500,
         content={
             "success": False,
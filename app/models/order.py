@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Text, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from enum import Enum as PyEnum
@@ -36,6 +36,10 @@ class Order(Base, IntIdMixin, TimeStampMixin):
     delivery = relationship("Delivery", back_populates="order", uselist=False)
 
 
+# Keyset pagination index (created_at, id)
+Index("ix_orders_user_created_id", Order.user_id, Order.created_at.desc(), Order.id.desc())
+
+
 class OrderItem(Base, IntIdMixin, TimeStampMixin):
     __tablename__ = "order_items"
 
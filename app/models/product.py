@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, ForeignKey, Enum
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, ForeignKey, Enum, Index, select, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, column_property, deferred
 from enum import Enum as PyEnum
 
 from .base import Base, IntIdMixin, TimeStampMixin
@@ -17,10 +18,15 @@ class Product(Base, IntIdMixin, TimeStampMixin):
 
     name = Column(String(200), nullable=False, index=True)
     description = Column(Text, nullable=False)
-    tags = Column(Text)  # JSON string of tags
+    tags = Column(JSONB)  # list of tag strings
     status = Column(Enum(ProductStatus), default=ProductStatus.DRAFT, nullable=False)
     is_featured = Column(Boolean, default=False)
     view_count = Column(Integer, default=0)
+    # Maintained by Postgres; deferred so ordinary product loads don't fetch it
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))", persisted=True)
+    ))
 
     # Foreign Keys
     subcategory_id = Column(Integer, ForeignKey("sub_categories.id"), nullable=True)
@@ -43,6 +49,21 @@ class Product(Base, IntIdMixin, TimeStampMixin):
     cart_items = relationship("CartItem", back_populates="product", cascade="all, delete-orphan")
 
 
+# Keyset pagination indexes (created_at, id)
+Index(
+    "ix_products_active_created_id",
+    Product.created_at.desc(), Product.id.desc(),
+    postgresql_where=Product.status == ProductStatus.ACTIVE
+)
+Index("ix_products_merchant_created_id", Product.merchant_id, Product.created_at.desc(), Product.id.desc())
+
+# Full-text search over name + description
+Index("ix_products_search_vector", Product.search_vector, postgresql_using="gin")
+
+# Tag containment (tags @> '["tag"]') probes
+Index("ix_products_tags_gin", Product.tags, postgresql_using="gin", postgresql_ops={"tags": "jsonb_path_ops"})
+
+
 class ProductImage(Base, IntIdMixin, TimeStampMixin):
     __tablename__ = "product_images"
 
@@ -58,6 +79,23 @@ class ProductImage(Base, IntIdMixin, TimeStampMixin):
     product = relationship("Product", back_populates="images")
 
 
+Index(
+    "ix_product_images_product_primary",
+    ProductImage.product_id, ProductImage.is_primary.desc(), ProductImage.sort_order, ProductImage.id
+)
+
+# Primary image (else the first by sort order) loaded in the product's own SELECT,
+# so list/cart/order lines don't need the images collection
+Product.primary_image_url = column_property(
+    select(ProductImage.url)
+    .where(ProductImage.product_id == Product.id)
+    .order_by(ProductImage.is_primary.desc(), ProductImage.sort_order, ProductImage.id)
+    .limit(1)
+    .correlate_except(ProductImage)
+    .scalar_subquery()
+)
+
+
 class ProductAttribute(Base, IntIdMixin, TimeStampMixin):
     __tablename__ = "product_attributes"
 
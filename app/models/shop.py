@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, Float, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Float, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from .base import Base, IntIdMixin, TimeStampMixin
 
@@ -22,3 +22,9 @@ class Shop(Base, IntIdMixin, TimeStampMixin):
     # Relationships
     merchant = relationship("User", back_populates="shops")
     products = relationship("Product", back_populates="shop")
+
+
+# Keyset pagination index (created_at, id)
+Index("ix_shops_merchant_created_id", Shop.merchant_id, Shop.created_at.desc(), Shop.id.desc())
+# Bounding-box prefilter for nearby searches
+Index("ix_shops_lat_lng", Shop.latitude, Shop.longitude, postgresql_where=Shop.is_active == True)
@@ -1,15 +1,19 @@
+from typing import List
+
 from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
 from app.core.dependencies import SuperUser
+from app.models import UserRole
 from app.schemas.user_schema import (
     SuperUserCreate,
     SuperUserLogin,
     ApproveRequest,
     ToggleFlagAPIResponse,
     LoginAPIResponse,
-    RoleUpdateRequest
+    RoleUpdateRequest,
+    UserResponse
 )
 from app.core.auth_service.auth_utils import login, update_role, _get_user_lists
 from app.core.auth_service.superuser_service import create_superuser, toggle_flag
@@ -46,8 +50,8 @@ async def toggle_admin_flag(req: ApproveRequest, db: AsyncSession = Depends(get_
 
 @router.post("/role/update")
 async def _update_role(req: RoleUpdateRequest, db: AsyncSession = Depends(get_async_db), actor: SuperUser = None):
-    return await update_role(db, actor, req.email, req.new_role)
+    return await update_role(db, actor, req.email, UserRole(req.new_role))
 
-@router.get("/users")
+@router.get("/users", response_model=List[UserResponse])
 async def get_users_lists(db: AsyncSession = Depends(get_async_db), _: SuperUser = None):
     return await _get_user_lists(db)
\ No newline at end of file
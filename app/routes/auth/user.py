@@ -2,7 +2,7 @@ from fastapi import APIRouter, Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
-from app.schemas import UserResponse, UserCreate, UserLogin
+from app.schemas import UserResponse, UserCreate, EmailOTP
 from app.schemas.user_schema import LoginAPIResponse
 from app.core.auth_service.user_service import login_user, create_user
 
@@ -15,7 +15,7 @@ async def _create_user(login_data: UserCreate, db: AsyncSession = Depends(get_as
 
 
 @router.post("/login", response_model=LoginAPIResponse)
-async def _login_user(login_data: UserLogin, db: AsyncSession = Depends(get_async_db)):
+async def _login_user(login_data: EmailOTP, db: AsyncSession = Depends(get_async_db)):
     return await login_user(db, login_data.email, login_data.verification_code)
 
 
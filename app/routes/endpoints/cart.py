@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_async_db
 from app.crud.cart_crud import cart_crud, cart_item_crud
+from app.crud.product_crud import product_crud
 
 from app.core.dependencies import RegularUser
 from app.schemas import ProductListResponse
@@ -14,28 +15,34 @@ from app.schemas.cart_schema import (
 router = APIRouter()
 
 
+def _line_price(snapshot: dict, unit_price: float) -> float:
+    """Current product price, or the line's stored price when the snapshot has none (no variants)."""
+    price = snapshot.get("price")
+    return unit_price if price is None else price
+
+
 @router.get("/", response_model=CartResponse)
 async def get_cart(
     current_user: RegularUser = None,
     db: AsyncSession = Depends(get_async_db)
 ):
     """Get user's shopping cart"""
-    cart = await cart_crud.get(db, user_id=current_user)
+    cart = await cart_crud.get_cart_with_items(db, current_user.id)
     
+    # Current price/stock for every line in one cache round-trip
+    snapshots = await product_crud.get_snapshots(db, [item.product_id for item in cart.items])
+
     # Convert cart items to response format
     cart_items = []
     for item in cart.items:
-        # Get primary image
-        primary_image = None
-        if item.product.images:
-            primary_img = next((img for img in item.product.images if img.is_primary), None)
-            primary_image = primary_img.url if primary_img else item.product.images[0].url
-        
+        primary_image = item.product.primary_image_url
+        snapshot = snapshots.get(item.product_id, {})
+
         product_response = ProductListResponse(
             id=item.product.id,
             name=item.product.name,
-            price=item.product.price,
-            stock_quantity=item.product.stock_quantity,
+            price=_line_price(snapshot, item.unit_price),
+            stock_quantity=snapshot.get("stock_quantity", 0),
             status=item.product.status,
             is_featured=item.product.is_featured,
             view_count=item.product.view_count,
@@ -73,19 +80,22 @@ async def add_to_cart(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Add item to cart"""
-    cart_item = await cart_crud.add_to_cart(current_user, request.product_id, request.quantity)
-    
-    # Get primary image
-    primary_image = None
-    if cart_item.product.images:
-        primary_img = next((img for img in cart_item.product.images if img.is_primary), None)
-        primary_image = primary_img.url if primary_img else cart_item.product.images[0].url
+    try:
+        cart_item = await cart_crud.add_to_cart(db, current_user.id, request.product_id, request.quantity)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
+    primary_image = cart_item.product.primary_image_url
+    snapshot = await product_crud.get_snapshot(db, cart_item.product_id) or {}
+
     product_response = ProductListResponse(
         id=cart_item.product.id,
         name=cart_item.product.name,
-        price=cart_item.product.price,
-        stock_quantity=cart_item.product.stock_quantity,
+        price=_line_price(snapshot, cart_item.unit_price),
+        stock_quantity=snapshot.get("stock_quantity", 0),
         status=cart_item.product.status,
         is_featured=cart_item.product.is_featured,
         view_count=cart_item.product.view_count,
@@ -113,19 +123,22 @@ async def update_cart_item(
     db: AsyncSession = Depends(get_async_db)
 ):
     """Update cart item quantity"""
-    cart_item = await cart_item_crud.update_cart_item(current_user, item_id, request.quantity)
-    
-    # Get primary image
-    primary_image = None
-    if cart_item.product.images:
-        primary_img = next((img for img in cart_item.product.images if img.is_primary), None)
-        primary_image = primary_img.url if primary_img else cart_item.product.images[0].url
+    try:
+        cart_item = await cart_item_crud.update_cart_item(db, current_user.id, item_id, request.quantity)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
     
+    primary_image = cart_item.product.primary_image_url
+    snapshot = await product_crud.get_snapshot(db, cart_item.product_id) or {}
+
     product_response = ProductListResponse(
         id=cart_item.product.id,
         name=cart_item.product.name,
-        price=cart_item.product.price,
-        stock_quantity=cart_item.product.stock_quantity,
+        price=_line_price(snapshot, cart_item.unit_price),
+        stock_quantity=snapshot.get("stock_quantity", 0),
         status=cart_item.product.status,
         is_featured=cart_item.product.is_featured,
         view_count=cart_item.product.view_count,
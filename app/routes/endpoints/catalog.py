@@ -1,12 +1,14 @@
 from fastapi import APIRouter, Depends, Query, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Optional
+from typing import List, Optional, Literal
+from pydantic import TypeAdapter
 from app.core.database import get_db
 from app.services.search import SearchService
 from app.services.recommendation import RecommendationService
 from app.schemas.search_schema import (
     SearchQuery, SearchResponse, SearchResult, 
-    RecommendationRequest, RecommendationResponse, TrendingProductsResponse
+    RecommendationRequest, RecommendationResponse, TrendingProductsResponse,
+    SearchSortBy, SortOrder
 )
 from app.schemas.product_schema import ProductListResponse
 from app.schemas.shop_schema import ShopResponse
@@ -15,6 +17,8 @@ from app.models.user import User
 
 router = APIRouter()
 
+_SEARCH_QUERY_ADAPTER = TypeAdapter(SearchQuery)
+
 
 @router.get("/search", response_model=SearchResponse)
 async def search_catalog(
@@ -28,26 +32,30 @@ async def search_catalog(
     location_lat: Optional[float] = Query(None, ge=-90, le=90),
     location_lng: Optional[float] = Query(None, ge=-180, le=180),
     radius_km: Optional[int] = Query(None, ge=1, le=50),
-    sort_by: str = Query("relevance", regex="^(relevance|price|distance|popularity|newest)$"),
-    sort_order: str = Query("desc", regex="^(asc|desc)$"),
+    sort_by: SearchSortBy = Query("relevance"),
+    sort_order: SortOrder = Query("desc"),
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
 ):
     """Advanced catalog search with filtering and ranking"""
-    search_query = SearchQuery(
-        q=q,
-        category_id=category_id,
-        min_price=min_price,
-        max_price=max_price,
-        in_stock=in_stock,
-        merchant_id=merchant_id,
-        shop_id=shop_id,
-        location_lat=location_lat,
-        location_lng=location_lng,
-        radius_km=radius_km,
-        sort_by=sort_by,
-        sort_order=sort_order
+    # Only pass what the client supplied; unset filters keep their defaults without re-validation
+    raw_query = {
+        "q": q,
+        "category_id": category_id,
+        "min_price": min_price,
+        "max_price": max_price,
+        "in_stock": in_stock,
+        "merchant_id": merchant_id,
+        "shop_id": shop_id,
+        "location_lat": location_lat,
+        "location_lng": location_lng,
+        "radius_km": radius_km,
+        "sort_by": sort_by,
+        "sort_order": sort_order
+    }
+    search_query = _SEARCH_QUERY_ADAPTER.validate_python(
+        {key: value for key, value in raw_query.items() if value is not None}
     )
     
     service = SearchService(db)
@@ -62,12 +70,8 @@ async def search_catalog(
         product = item['product']
         shop = item['shop']
         
-        # Get primary image
-        primary_image = None
-        if product.images:
-            primary_img = next((img for img in product.images if img.is_primary), None)
-            primary_image = primary_img.url if primary_img else product.images[0].url
-        
+        primary_image = product.primary_image_url
+
         product_response = ProductListResponse(
             id=product.id,
             name=product.name,
@@ -128,7 +132,7 @@ async def get_recommendations(
     user_id: Optional[int] = Query(None),
     product_id: Optional[int] = Query(None),
     category_id: Optional[int] = Query(None),
-    recommendation_type: str = Query("personalized", regex="^(personalized|similar|collaborative|category)$"),
+    recommendation_type: Literal["personalized", "similar", "collaborative", "category"] = Query("personalized"),
     limit: int = Query(10, ge=1, le=50),
     current_user: Optional[User] = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
@@ -170,12 +174,8 @@ async def get_recommendations(
     for item in recommendations:
         product = item['product']
         
-        # Get primary image
-        primary_image = None
-        if product.images:
-            primary_img = next((img for img in product.images if img.is_primary), None)
-            primary_image = primary_img.url if primary_img else product.images[0].url
-        
+        primary_image = product.primary_image_url
+
         product_response = ProductListResponse(
             id=product.id,
             name=product.name,
@@ -199,7 +199,7 @@ async def get_recommendations(
 
 @router.get("/trending", response_model=TrendingProductsResponse)
 async def get_trending_products(
-    period: str = Query("week", regex="^(day|week|month)$"),
+    period: Literal["day", "week", "month"] = Query("week"),
     limit: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db)
 ):
@@ -216,12 +216,8 @@ async def get_trending_products(
     for item in recommendations:
         product = item['product']
         
-        # Get primary image
-        primary_image = None
-        if product.images:
-            primary_img = next((img for img in product.images if img.is_primary), None)
-            primary_image = primary_img.url if primary_img else product.images[0].url
-        
+        primary_image = product.primary_image_url
+
         product_response = ProductListResponse(
             id=product.id,
             name=product.name,
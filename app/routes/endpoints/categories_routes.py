@@ -19,7 +19,7 @@ from app.schemas.category_schema import (
     SubCategoryStats,
     PaginatedResponse
 )
-from app.crud.category_crud import CategoryService, SubCategoryService
+from app.crud.category_crud import category_crud, subcategory_crud
 from app.core.dependencies import CurrentUser, AdminUser
 
 router = APIRouter(prefix="/categories", tags=["categories"])
@@ -33,9 +33,8 @@ async def create_category(
         admin_user: AdminUser = Depends()
 ):
     """Create a new category (Admin only)."""
-    service = CategoryService()
     try:
-        return await service.create_category(db, **category_data.model_dump())
+        return await category_crud.create_category(db, **category_data.model_dump())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -50,8 +49,7 @@ async def get_categories(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get all categories."""
-    service = CategoryService()
-    return await service.get_active_categories(db, include_children, 0, 1000)
+    return await category_crud.get_active_categories(db, include_children, 0, 1000)
 
 
 @router.get("/tree", response_model=CategoryTreeResponse)
@@ -59,8 +57,7 @@ async def get_category_tree(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get complete category hierarchy."""
-    service = CategoryService()
-    categories = await service.get_category_tree(db)
+    categories = await category_crud.get_category_tree(db)
     return {"categories": categories}
 
 
@@ -70,8 +67,7 @@ async def get_category(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get specific category with children."""
-    service = CategoryService()
-    category = await service.get_category_with_children(db, category_id)
+    category = await category_crud.get_category_with_children(db, category_id)
     if not category or not category.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -79,8 +75,7 @@ async def get_category(
         )
 
     # Get subcategories for this category
-    subcategory_service = SubCategoryService()
-    category.subcategories = await subcategory_service.get_category_subcategories(db, category_id)
+    category.subcategories = await subcategory_crud.get_category_subcategories(db, category_id)
 
     return category
 
@@ -91,19 +86,17 @@ async def get_category_by_slug(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get category by slug."""
-    service = CategoryService()
-    category = await service.get_by_slug(db, slug)
+    category = await category_crud.get_by_slug(db, slug)
     if not category or not category.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Category not found"
         )
 
-    category.children = await service.get_category_children(db, category.id)
+    category.children = await category_crud.get_category_children(db, category.id)
 
     # Get subcategories for this category
-    subcategory_service = SubCategoryService()
-    category.subcategories = await subcategory_service.get_category_subcategories(db, category.id)
+    category.subcategories = await subcategory_crud.get_category_subcategories(db, category.id)
 
     return category
 
@@ -116,9 +109,8 @@ async def update_category(
         admin_user: AdminUser = Depends()
 ):
     """Update category (Admin only)."""
-    service = CategoryService()
     try:
-        category = await service.update_category(db, category_id, **category_data.model_dump(exclude_unset=True))
+        category = await category_crud.update_category(db, category_id, **category_data.model_dump(exclude_unset=True))
         if not category:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -139,8 +131,7 @@ async def toggle_category_status(
         admin_user: AdminUser = Depends()
 ):
     """Toggle category active status (Admin only)."""
-    service = CategoryService()
-    category = await service.toggle_category_status(db, category_id)
+    category = await category_crud.toggle_category_status(db, category_id)
     if not category:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -155,10 +146,9 @@ async def search_categories(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Search categories with pagination."""
-    service = CategoryService()
     skip = (search_params.page - 1) * search_params.per_page
 
-    categories = await service.search_categories(
+    categories = await category_crud.search_categories(
         db,
         search_term=search_params.search_term,
         active_only=search_params.active_only,
@@ -166,7 +156,7 @@ async def search_categories(
         limit=search_params.per_page
     )
 
-    total = await service.count(db, filters={"is_active": True} if search_params.active_only else {})
+    total = await category_crud.count(db, filters={"is_active": True} if search_params.active_only else {})
 
     return {
         "items": categories,
@@ -184,8 +174,7 @@ async def get_category_stats(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get category statistics."""
-    service = CategoryService()
-    return await service.get_category_stats(db)
+    return await category_crud.get_category_stats(db)
 
 
 # SubCategory Routes
@@ -196,9 +185,8 @@ async def create_subcategory(
         admin_user: AdminUser = Depends()
 ):
     """Create a new subcategory (Admin only)."""
-    service = SubCategoryService()
     try:
-        return await service.create_subcategory(db, **subcategory_data.model_dump())
+        return await subcategory_crud.create_subcategory(db, **subcategory_data.model_dump())
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -213,8 +201,7 @@ async def get_category_subcategories(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get all subcategories for a specific category."""
-    service = SubCategoryService()
-    return await service.get_category_subcategories(db, category_id, active_only, 0, 1000)
+    return await subcategory_crud.get_category_subcategories(db, category_id, active_only, 0, 1000)
 
 
 @router.get("/subcategories/{subcategory_id}", response_model=SubCategoryWithCategoryResponse)
@@ -223,8 +210,7 @@ async def get_subcategory(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get specific subcategory with category information."""
-    service = SubCategoryService()
-    subcategory = await service.get_subcategory_with_category(db, subcategory_id)
+    subcategory = await subcategory_crud.get_subcategory_with_category(db, subcategory_id)
     if not subcategory or not subcategory.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -241,9 +227,8 @@ async def update_subcategory(
         admin_user: AdminUser = Depends()
 ):
     """Update subcategory (Admin only)."""
-    service = SubCategoryService()
     try:
-        subcategory = await service.update_subcategory(db, subcategory_id,
+        subcategory = await subcategory_crud.update_subcategory(db, subcategory_id,
                                                        **subcategory_data.model_dump(exclude_unset=True))
         if not subcategory:
             raise HTTPException(
@@ -265,8 +250,7 @@ async def toggle_subcategory_status(
         admin_user: AdminUser = Depends()
 ):
     """Toggle subcategory active status (Admin only)."""
-    service = SubCategoryService()
-    subcategory = await service.toggle_subcategory_status(db, subcategory_id)
+    subcategory = await subcategory_crud.toggle_subcategory_status(db, subcategory_id)
     if not subcategory:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -281,10 +265,9 @@ async def search_subcategories(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Search subcategories with pagination."""
-    service = SubCategoryService()
     skip = (search_params.page - 1) * search_params.per_page
 
-    subcategories = await service.search_subcategories(
+    subcategories = await subcategory_crud.search_subcategories(
         db,
         search_term=search_params.search_term,
         category_id=search_params.category_id,
@@ -293,7 +276,7 @@ async def search_subcategories(
         limit=search_params.per_page
     )
 
-    total = await service.count(db, filters={"is_active": True} if search_params.active_only else {})
+    total = await subcategory_crud.count(db, filters={"is_active": True} if search_params.active_only else {})
 
     return {
         "items": subcategories,
@@ -312,5 +295,4 @@ async def get_subcategory_stats(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get subcategory statistics."""
-    service = SubCategoryService()
-    return await service.get_subcategory_stats(db, category_id)
\ No newline at end of file
+    return await subcategory_crud.get_subcategory_stats(db, category_id)
\ No newline at end of file
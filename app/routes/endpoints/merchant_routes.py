@@ -15,7 +15,7 @@ from app.schemas import (
     PaginatedResponse
 )
 from app.crud.merchant_crud import  merchant_crud
-from app.core.dependencies import AdminUser, RegularUser
+from app.core.dependencies import AdminUser, RegularUser, invalidate_merchant_status
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +32,9 @@ async def create_merchant_application(
     existing_application = await merchant_crud.check_duplicate_applications(db, application_data.business_email, application_data.tax_id)
     if existing_application:
         raise Exceptions.conflict(detail="You already applied")
-    return await merchant_crud.create_application(db, user.id, **application_data.model_dump())
+    application = await merchant_crud.create_application(db, user.id, **application_data.model_dump())
+    await invalidate_merchant_status(user.id)
+    return application
 
 
 @router.get("/my-application", response_model=Optional[MerchantApplicationResponse])
@@ -123,6 +125,7 @@ async def update_application_status(
         else:
             raise Exceptions.bad_request()
 
+        await invalidate_merchant_status(application.user_id)
         logger.info(f"Application updated successfully: {application}")
         return application
 
@@ -8,6 +8,9 @@ from app.schemas.order_schema import (
     OrderStatusUpdate, OrderItemResponse
 )
 from app.schemas.product_schema import ProductListResponse
+from app.schemas.schema_base import CursorPage
+from app.crud.order_crud import order_crud
+from app.core.utils.response.exceptions import Exceptions
 from app.api.dependencies import get_current_active_user, get_current_admin
 from app.models.user import User
 from app.models.order import OrderStatus
@@ -31,11 +34,8 @@ async def checkout(
         # Get product details if available
         product_response = None
         if item.product:
-            primary_image = None
-            if item.product.images:
-                primary_img = next((img for img in item.product.images if img.is_primary), None)
-                primary_image = primary_img.url if primary_img else item.product.images[0].url
-            
+            primary_image = item.product.primary_image_url
+
             product_response = ProductListResponse(
                 id=item.product.id,
                 name=item.product.name,
@@ -76,30 +76,32 @@ async def checkout(
     )
 
 
-@router.get("/", response_model=List[OrderListResponse])
+@router.get("/", response_model=CursorPage[OrderListResponse])
 async def get_user_orders(
-    skip: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """Get user's order history"""
-    service = OrderService(db)
-    orders, total = await service.get_user_orders(current_user, skip, limit)
+    try:
+        orders, next_cursor = await order_crud.get_user_orders(db, current_user.id, cursor=cursor, limit=limit)
+    except ValueError:
+        Exceptions.bad_request("Invalid cursor")
     
     # Convert to list response format
     order_list = []
-    for order in orders:
+    for order, items_count in orders:
         order_list.append(OrderListResponse(
             id=order.id,
             order_number=order.order_number,
             status=order.status,
             total_amount=order.total_amount,
-            items_count=len(order.items),
+            items_count=items_count,
             created_at=order.created_at
         ))
     
-    return order_list
+    return {"items": order_list, "next_cursor": next_cursor, "has_next": next_cursor is not None}
 
 
 @router.get("/{order_id}", response_model=OrderResponse)
@@ -118,11 +120,8 @@ async def get_order(
         # Get product details if available
         product_response = None
         if item.product:
-            primary_image = None
-            if item.product.images:
-                primary_img = next((img for img in item.product.images if img.is_primary), None)
-                primary_image = primary_img.url if primary_img else item.product.images[0].url
-            
+            primary_image = item.product.primary_image_url
+
             product_response = ProductListResponse(
                 id=item.product.id,
                 name=item.product.name,
@@ -215,18 +214,17 @@ async def get_orders_by_status(
     db: AsyncSession = Depends(get_db)
 ):
     """Get orders by status (admin only)"""
-    service = OrderService(db)
-    orders, total = await service.get_orders_by_status(status, skip, limit)
+    orders = await order_crud.get_orders_by_status(db, status, skip, limit)
     
     # Convert to list response format
     order_list = []
-    for order in orders:
+    for order, items_count in orders:
         order_list.append(OrderListResponse(
             id=order.id,
             order_number=order.order_number,
             status=order.status,
             total_amount=order.total_amount,
-            items_count=len(order.items),
+            items_count=items_count,
             created_at=order.created_at
         ))
     
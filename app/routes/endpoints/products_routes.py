@@ -1,6 +1,7 @@
+import hashlib
 from typing import List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
@@ -14,78 +15,103 @@ from app.schemas import (
     ProductImageResponse,
     ProductVariantCreate,
     ProductVariantResponse,
-    PaginatedResponse
+    CursorPage
 )
-from app.crud.product_crud import ProductService
-from app.crud.merchant_crud import MerchantService
-from app.core.dependencies import CurrentUser
+from app.crud.product_crud import product_crud
+from app.models import ProductStatus
+from app.core.dependencies import CurrentUser, ApprovedMerchant
+from app.core.utils.response.exceptions import Exceptions
+from app.core.cache import cache, cached_json
+from app.core.tasks import record_product_view
+from app.schemas.adapters import PRODUCT_ADAPTER, PRODUCT_LIST_ADAPTER
+from app.core.utils.etag import weak_etag, etag_matches, not_modified, get_version, bump_version
+
+FEATURED_CACHE_PREFIX = "products:featured:"
+POPULAR_CACHE_PREFIX = "products:popular:"
+PRODUCT_DETAIL_CACHE_PREFIX = "products:detail:"
+SEARCH_CACHE_PREFIX = "products:search:"
+PRODUCT_LIST_CACHE_TTL = 60
+PRODUCT_DETAIL_CACHE_TTL = 30
 
 router = APIRouter(prefix="/products", tags=["products"])
 
 
+async def _invalidate_product_cache(product_id: int):
+    """Drop the cached product detail, cart snapshot and featured/popular lists after a product changes."""
+    await bump_version("products")
+    await product_crud.invalidate_snapshot(product_id)
+    await cache.delete_prefix(f"{PRODUCT_DETAIL_CACHE_PREFIX}{product_id}:")
+    await cache.delete_prefix(FEATURED_CACHE_PREFIX)
+    await cache.delete_prefix(POPULAR_CACHE_PREFIX)
+
+
 @router.post("/", response_model=ProductResponse, status_code=status.HTTP_201_CREATED)
 async def create_product(
         product_data: ProductCreate,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: ApprovedMerchant,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new product (Merchant only)."""
-    # Check if user is approved merchant
-    merchant_service = MerchantService()
-    application = await merchant_service.get_user_application(db, current_user.id)
-    if not application or application.status != "approved":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You need to be an approved merchant to create products"
-        )
-
-    service = ProductService()
-    return await service.create_product(db, current_user.id, **product_data.model_dump())
+    product = await product_crud.create_product(db, current_user.id, **product_data.model_dump())
+    await _invalidate_product_cache(product.id)
+    return product
 
 
-@router.get("/", response_model=PaginatedResponse[ProductResponse])
+@router.get("/", response_model=CursorPage[ProductResponse])
 async def search_products(
         search_params: ProductSearch = Depends(),
         db: AsyncSession = Depends(get_async_db)
 ):
     """Search products with various filters."""
-    service = ProductService()
-    skip = (search_params.page - 1) * search_params.per_page
-
-    products = await service.search_products(
-        db,
-        search_term=search_params.search_term,
-        category_id=search_params.category_id,
-        shop_id=search_params.shop_id,
-        min_price=search_params.min_price,
-        max_price=search_params.max_price,
-        status=search_params.status or "active",
-        featured_only=search_params.featured_only,
-        skip=skip,
-        limit=search_params.per_page
-    )
+    # The products version is part of the key, so any product change retires cached pages
+    version = await get_version("products")
+    query_hash = hashlib.blake2b(search_params.model_dump_json().encode(), digest_size=16).hexdigest()
+
+    async def _load():
+        try:
+            products, next_cursor = await product_crud.search_products(
+                db,
+                search_term=search_params.search_term,
+                category_id=search_params.category_id,
+                shop_id=search_params.shop_id,
+                min_price=search_params.min_price,
+                max_price=search_params.max_price,
+                status=search_params.status or "active",
+                featured_only=search_params.featured_only,
+                cursor=search_params.cursor,
+                limit=search_params.per_page
+            )
+        except ValueError:
+            Exceptions.bad_request("Invalid cursor")
 
-    total = await service.count(db, filters={"status": "active"})
+        return {
+            "items": PRODUCT_LIST_ADAPTER.dump_python(PRODUCT_LIST_ADAPTER.validate_python(products), mode="json"),
+            "next_cursor": next_cursor,
+            "has_next": next_cursor is not None
+        }
 
-    return {
-        "items": products,
-        "total": total,
-        "page": search_params.page,
-        "per_page": search_params.per_page,
-        "total_pages": (total + search_params.per_page - 1) // search_params.per_page,
-        "has_next": search_params.page * search_params.per_page < total,
-        "has_prev": search_params.page > 1
-    }
+    return await cached_json(f"{SEARCH_CACHE_PREFIX}{version}:{query_hash}", PRODUCT_LIST_CACHE_TTL, _load)
 
 
 @router.get("/featured", response_model=List[ProductResponse])
 async def get_featured_products(
+        request: Request,
         limit: int = 20,
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get featured products."""
-    service = ProductService()
-    return await service.get_featured_products(db, limit)
+    version = await get_version("products")
+    etag = weak_etag("featured", limit, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    async def _load():
+        products = await product_crud.get_featured_products(db, limit)
+        return PRODUCT_LIST_ADAPTER.dump_python(PRODUCT_LIST_ADAPTER.validate_python(products), mode="json")
+
+    response = await cached_json(f"{FEATURED_CACHE_PREFIX}{limit}:{version}", PRODUCT_LIST_CACHE_TTL, _load)
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.get("/popular", response_model=List[ProductResponse])
@@ -94,80 +120,107 @@ async def get_popular_products(
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get popular products."""
-    service = ProductService()
-    return await service.get_popular_products(db, limit)
+
+    async def _load():
+        products = await product_crud.get_popular_products(db, limit)
+        return PRODUCT_LIST_ADAPTER.dump_python(PRODUCT_LIST_ADAPTER.validate_python(products), mode="json")
+
+    return await cached_json(f"{POPULAR_CACHE_PREFIX}{limit}", PRODUCT_LIST_CACHE_TTL, _load)
 
 
 @router.get("/{product_id}", response_model=ProductResponse)
 async def get_product(
         product_id: int,
+        request: Request,
+        background_tasks: BackgroundTasks,
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get specific product details."""
-    service = ProductService()
-    product = await service.get(db, obj_id=product_id)
-    if not product or product.status != "active":
+    # Status is checked here, before the ETag, so inactive products never answer 304 or count views
+    row = await product_crud.get(db, obj_id=product_id, columns=["status", "updated_at"])
+    if row is None or row.status != ProductStatus.ACTIVE:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found"
         )
+    updated_at = row.updated_at
 
-    # Increment view count
-    await service.increment_view_count(db, product_id)
-    return product
+    # Buffered off the request path; flushed to the database in batches
+    background_tasks.add_task(record_product_view, product_id)
+
+    version = int(updated_at.timestamp() * 1000)
+    etag = weak_etag(product_id, version)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    async def _load():
+        product = await product_crud.get_product(db, product_id)
+        if not product or product.status != ProductStatus.ACTIVE:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Product not found"
+            )
+        return PRODUCT_ADAPTER.dump_python(PRODUCT_ADAPTER.validate_python(product), mode="json")
+
+    response = await cached_json(
+        f"{PRODUCT_DETAIL_CACHE_PREFIX}{product_id}:{version}", PRODUCT_DETAIL_CACHE_TTL, _load
+    )
+    response.headers["ETag"] = etag
+    return response
 
 
 @router.put("/{product_id}", response_model=ProductResponse)
 async def update_product(
         product_id: int,
         product_data: ProductUpdate,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Update product details (Product owner only)."""
-    service = ProductService()
-    product = await service.get(db, obj_id=product_id)
+    product = await product_crud.get(db, obj_id=product_id)
     if not product or product.merchant_id != current_user.id:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or access denied"
         )
 
-    return await service.update(db, obj_id=product_id, **product_data.model_dump(exclude_unset=True))
+    product = await product_crud.update(db, obj_id=product_id, **product_data.model_dump(exclude_unset=True))
+    await _invalidate_product_cache(product_id)
+    return product
 
 
 @router.patch("/{product_id}/status", response_model=ProductResponse)
 async def update_product_status(
         product_id: int,
         status: str,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Update product status (Product owner only)."""
-    service = ProductService()
-    product = await service.update_product_status(db, product_id, current_user.id, status)
+    product = await product_crud.update_product_status(db, product_id, current_user.id, status)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or access denied"
         )
+    await _invalidate_product_cache(product_id)
     return product
 
 
 @router.patch("/{product_id}/toggle-featured", response_model=ProductResponse)
 async def toggle_featured_status(
         product_id: int,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Toggle product featured status (Product owner only)."""
-    service = ProductService()
-    product = await service.toggle_featured_status(db, product_id, current_user.id)
+    product = await product_crud.toggle_featured_status(db, product_id, current_user.id)
     if not product:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or access denied"
         )
+    await _invalidate_product_cache(product_id)
     return product
 
 
@@ -175,17 +228,18 @@ async def toggle_featured_status(
 async def add_product_image(
         product_id: int,
         image_data: ProductImageCreate,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Add image to product (Product owner only)."""
-    service = ProductService()
-    image = await service.add_product_image(db, product_id, current_user.id, **image_data.model_dump())
+    image = await product_crud.add_product_image(db, product_id, current_user.id, **image_data.model_dump())
     if not image:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or access denied"
         )
+    await product_crud.touch(db, product_id)
+    await _invalidate_product_cache(product_id)
     return image
 
 
@@ -193,25 +247,25 @@ async def add_product_image(
 async def add_product_variant(
         product_id: int,
         variant_data: ProductVariantCreate,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Add variant to product (Product owner only)."""
-    service = ProductService()
-    variant = await service.create_product_variant(db, product_id, current_user.id, **variant_data.model_dump())
+    variant = await product_crud.create_product_variant(db, product_id, current_user.id, **variant_data.model_dump())
     if not variant:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found or access denied"
         )
+    await product_crud.touch(db, product_id)
+    await _invalidate_product_cache(product_id)
     return variant
 
 
 @router.get("/stats/my-products", response_model=ProductStats)
 async def get_my_product_stats(
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's product statistics."""
-    service = ProductService()
-    return await service.get_product_stats(db, current_user.id)
\ No newline at end of file
+    return await product_crud.get_product_stats(db, current_user.id)
\ No newline at end of file
@@ -1,20 +1,38 @@
-from typing import List
+from operator import itemgetter
+from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_async_db
 from app.schemas import (
     ShopCreate,
     ShopResponse,
+    NearbyShopResponse,
     ShopUpdate,
     ShopSearch,
     ShopStats,
-    PaginatedResponse
+    PaginatedResponse,
+    CursorPage
+)
+from app.crud.shop_crud import shop_crud, haversine_km
+from app.core.dependencies import CurrentUser, ApprovedMerchant
+from app.core.utils.response.exceptions import Exceptions
+from app.schemas.adapters import (
+    SHOP_ADAPTER, SHOP_LIST_ADAPTER, SHOP_PAGE_ADAPTER, SHOP_CURSOR_PAGE_ADAPTER, SHOP_STATS_ADAPTER, render_json
+)
+from app.core.cache import cache, cached_json, cached_value
+from app.core.utils.etag import (
+    weak_etag, etag_matches, unmodified_since, http_date, not_modified, get_version, bump_version, query_fingerprint
 )
-from app.crud.shop_crud import shop_crud
-from app.core.dependencies import CurrentUser
-from app.crud.merchant_crud import merchant_crud
+
+SHOP_DETAIL_CACHE_PREFIX = "shops:detail:"
+SHOP_DETAIL_CACHE_TTL = 300
+NEARBY_CACHE_PREFIX = "shops:nearby:"
+NEARBY_CACHE_TTL = 60
+NEARBY_COORD_PRECISION = 2  # ~1.1km grid, roughly a precision-6 geohash cell
+NEARBY_GRID_PAD_KM = 0.8  # farthest a point can be from its cell's center (half the cell diagonal)
+NEARBY_CANDIDATE_LIMIT = 500
 
 router = APIRouter(prefix="/shops", tags=["shops"])
 
@@ -22,41 +40,61 @@ router = APIRouter(prefix="/shops", tags=["shops"])
 @router.post("/", response_model=ShopResponse, status_code=status.HTTP_201_CREATED)
 async def create_shop(
         shop_data: ShopCreate,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: ApprovedMerchant,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Create a new shop (Merchant only)."""
-    # Check if user is approved merchant
-
-    application = await merchant_crud.get_user_application(db, current_user.id)
-    if not application or application.status != "approved":
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You need to be an approved merchant to create a shop"
-        )
-
-    return await shop_crud.create_shop(db, current_user.id, **shop_data.model_dump())
+    # dict(model) is a shallow field copy; no serializer pass is needed for these flat schemas
+    shop = await shop_crud.create_shop(db, current_user.id, **dict(shop_data))
+    await bump_version("shops")
+    return shop
 
 
-@router.get("/my-shops", response_model=List[ShopResponse])
+@router.get("/my-shops", response_model=CursorPage[ShopResponse])
 async def get_my_shops(
+        request: Request,
+        current_user: CurrentUser,
         active_only: bool = True,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        cursor: Optional[str] = None,
+        limit: int = Query(20, ge=1, le=100),
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's shops."""
-    return await shop_crud.get_merchant_shops(db, current_user.id, active_only)
+    # Every shop write bumps the "shops" version, so this ETag changes whenever the page could
+    etag = weak_etag("my-shops", current_user.id, await get_version("shops"), query_fingerprint(request))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    try:
+        shops, next_cursor = await shop_crud.get_merchant_shops(
+            db, current_user.id, active_only, cursor=cursor, limit=limit
+        )
+    except ValueError:
+        Exceptions.bad_request("Invalid cursor")
+
+    # Serialized here in one pass; returning a Response skips FastAPI's response_model re-validation
+    page = {"items": shops, "next_cursor": next_cursor, "has_next": next_cursor is not None}
+    return Response(
+        content=render_json(SHOP_CURSOR_PAGE_ADAPTER, page),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
 @router.get("/", response_model=PaginatedResponse[ShopResponse])
 async def search_shops(
+        request: Request,
         search_params: ShopSearch = Depends(),
         db: AsyncSession = Depends(get_async_db)
 ):
     """Search shops with various filters."""
+    etag = weak_etag("shops", await get_version("shops"), query_fingerprint(request))
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     skip = (search_params.page - 1) * search_params.per_page
 
-    shops = await shop_crud.search_shops(
+    shops, total = await shop_crud.search_shops(
         db,
         search_term=search_params.search_term,
         latitude=search_params.latitude,
@@ -67,68 +105,124 @@ async def search_shops(
         limit=search_params.per_page
     )
 
-    total = await shop_crud.count(db, filters={"is_active": True} if search_params.active_only else {})
-
-    return {
-        "items": shops,
-        "total": total,
-        "page": search_params.page,
-        "per_page": search_params.per_page,
-        "total_pages": (total + search_params.per_page - 1) // search_params.per_page,
-        "has_next": search_params.page * search_params.per_page < total,
-        "has_prev": search_params.page > 1
-    }
+    page = PaginatedResponse[ShopResponse].build(
+        SHOP_LIST_ADAPTER.validate_python(shops), total, search_params.page, search_params.per_page
+    )
+    return Response(
+        content=SHOP_PAGE_ADAPTER.dump_json(page),
+        media_type="application/json",
+        headers={"ETag": etag}
+    )
 
 
-@router.get("/nearby", response_model=List[ShopResponse])
+@router.get("/nearby", response_model=List[NearbyShopResponse])
 async def get_nearby_shops(
-        latitude: float,
-        longitude: float,
-        radius_km: float = 10.0,
-        limit: int = 50,
+        latitude: float = Query(..., ge=-90, le=90),
+        longitude: float = Query(..., ge=-180, le=180),
+        radius_km: float = Query(10.0, gt=0, le=100),
+        limit: int = Query(50, ge=1, le=100),
         db: AsyncSession = Depends(get_async_db)
 ):
-    """Get shops near a specific location."""
-    return await shop_crud.get_nearby_shops(db, latitude, longitude, radius_km, limit)
+    """Get shops near a specific location, nearest first."""
+    # Requests in the same grid cell share one cached candidate set: every shop within the radius
+    # padded by the cell size. Filtering and distances use the caller's real coordinates.
+    lat_cell = round(latitude, NEARBY_COORD_PRECISION)
+    lng_cell = round(longitude, NEARBY_COORD_PRECISION)
+    version = await get_version("shops")
+    key = f"{NEARBY_CACHE_PREFIX}{version}:{lat_cell}:{lng_cell}:{radius_km:g}"
+
+    async def _load_candidates():
+        rows = await shop_crud.get_nearby_shops(
+            db, lat_cell, lng_cell, radius_km + NEARBY_GRID_PAD_KM, NEARBY_CANDIDATE_LIMIT
+        )
+        return {
+            "complete": len(rows) < NEARBY_CANDIDATE_LIMIT,
+            "shops": SHOP_LIST_ADAPTER.dump_python(
+                SHOP_LIST_ADAPTER.validate_python([shop for shop, _ in rows]), mode="json"
+            )
+        }
+
+    candidates = await cached_value(key, NEARBY_CACHE_TTL, _load_candidates)
+
+    if not candidates["complete"]:
+        # Dense area: the capped candidate set may miss closer shops, so query around the real point
+        rows = await shop_crud.get_nearby_shops(db, latitude, longitude, radius_km, limit)
+        shops = SHOP_LIST_ADAPTER.dump_python(
+            SHOP_LIST_ADAPTER.validate_python([shop for shop, _ in rows]), mode="json"
+        )
+        return [{**shop, "distance_km": distance} for shop, (_, distance) in zip(shops, rows)]
+
+    nearby = []
+    for shop in candidates["shops"]:
+        distance = haversine_km(latitude, longitude, shop["latitude"], shop["longitude"])
+        if distance <= radius_km:
+            nearby.append({**shop, "distance_km": distance})
+    nearby.sort(key=itemgetter("distance_km"))
+    return nearby[:limit]
 
 
 @router.get("/{shop_id}", response_model=ShopResponse)
 async def get_shop(
         shop_id: int,
+        request: Request,
         db: AsyncSession = Depends(get_async_db)
 ):
     """Get specific shop details."""
-    shop = await shop_crud.get(db, obj_id=shop_id)
-    if not shop or not shop.is_active:
+    # Checked before the ETag so a deactivated shop answers 404, not 304
+    row = await shop_crud.get(db, obj_id=shop_id, columns=["is_active", "updated_at"])
+    if row is None or not row.is_active:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Shop not found"
         )
-    return shop
+    updated_at = row.updated_at
+
+    version = int(updated_at.timestamp() * 1000)
+    etag = weak_etag(shop_id, version)
+    if etag_matches(request, etag) or unmodified_since(request, updated_at):
+        return not_modified(etag)
+
+    async def _load():
+        shop = await shop_crud.get(db, obj_id=shop_id)
+        if not shop or not shop.is_active:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Shop not found"
+            )
+        return SHOP_ADAPTER.dump_python(SHOP_ADAPTER.validate_python(shop), mode="json")
+
+    response = await cached_json(f"{SHOP_DETAIL_CACHE_PREFIX}{shop_id}:{version}", SHOP_DETAIL_CACHE_TTL, _load)
+    response.headers["ETag"] = etag
+    response.headers["Last-Modified"] = http_date(updated_at)
+    return response
 
 
 @router.put("/{shop_id}", response_model=ShopResponse)
 async def update_shop(
         shop_id: int,
         shop_data: ShopUpdate,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Update shop details (Shop owner only)."""
-    shop = await shop_crud.update_shop(db, shop_id, current_user.id, **shop_data.model_dump(exclude_unset=True))
+    update_data = {field: getattr(shop_data, field) for field in shop_data.model_fields_set}
+    shop = await shop_crud.update_shop(db, shop_id, current_user.id, **update_data)
     if not shop:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Shop not found or access denied"
         )
+    await bump_version("shops")
+    await cache.delete_prefix(f"{SHOP_DETAIL_CACHE_PREFIX}{shop_id}:")
+    await cache.delete_prefix(NEARBY_CACHE_PREFIX)
     return shop
 
 
 @router.patch("/{shop_id}/toggle-status", response_model=ShopResponse)
 async def toggle_shop_status(
         shop_id: int,
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Toggle shop active status (Shop owner only)."""
     shop = await shop_crud.toggle_shop_status(db, shop_id, current_user.id)
@@ -137,13 +231,17 @@ async def toggle_shop_status(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Shop not found or access denied"
         )
+    await bump_version("shops")
+    await cache.delete_prefix(f"{SHOP_DETAIL_CACHE_PREFIX}{shop_id}:")
+    await cache.delete_prefix(NEARBY_CACHE_PREFIX)
     return shop
 
 
 @router.get("/stats/my-shops", response_model=ShopStats)
 async def get_my_shop_stats(
-        db: AsyncSession = Depends(get_async_db),
-        current_user: CurrentUser = Depends()
+        current_user: CurrentUser,
+        db: AsyncSession = Depends(get_async_db)
 ):
     """Get current user's shop statistics."""
-    return await shop_crud.get_shop_stats(db, current_user.id)
\ No newline at end of file
+    stats = await shop_crud.get_shop_stats(db, current_user.id)
+    return Response(content=render_json(SHOP_STATS_ADAPTER, stats), media_type="application/json")
\ No newline at end of file
@@ -11,4 +11,4 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_user)
 ):
     """Get current authenticated user information"""
-    return UserResponse.model_validate(current_user)
+    return current_user
@@ -0,0 +1,35 @@
+from typing import Any, List
+
+from pydantic import TypeAdapter
+
+from .product_schema import ProductResponse
+from .schema_base import CursorPage, PaginatedResponse
+from .shop_schema import ShopResponse, ShopStats
+from .user_schema import UserResponse
+
+# Built once at import so endpoints don't rebuild validators per request
+PRODUCT_ADAPTER = TypeAdapter(ProductResponse)
+PRODUCT_LIST_ADAPTER = TypeAdapter(List[ProductResponse])
+SHOP_ADAPTER = TypeAdapter(ShopResponse)
+SHOP_LIST_ADAPTER = TypeAdapter(List[ShopResponse])
+USER_LIST_ADAPTER = TypeAdapter(List[UserResponse])
+SHOP_PAGE_ADAPTER = TypeAdapter(PaginatedResponse[ShopResponse])
+SHOP_CURSOR_PAGE_ADAPTER = TypeAdapter(CursorPage[ShopResponse])
+SHOP_STATS_ADAPTER = TypeAdapter(ShopStats)
+
+
+def render_json(adapter: TypeAdapter, data: Any) -> bytes:
+    """Validate data (ORM objects allowed) and serialize straight to JSON bytes in pydantic-core."""
+    return adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+
+
+def user_response(user: Any) -> UserResponse:
+    """UserResponse for a trusted ORM user, built without re-validating its columns."""
+    return UserResponse.model_construct(
+        id=user.id,
+        email=user.email,
+        role=user.role,
+        unique_id=user.unique_id,
+        created_at=user.created_at,
+        updated_at=user.updated_at
+    )
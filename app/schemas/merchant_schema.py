@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import Optional
-from pydantic import EmailStr, field_validator
-from .schema_base import BaseSchema, IDSchema, TimestampSchema
+from pydantic import field_validator
+from .schema_base import BaseSchema, IDSchema, TimestampSchema, Email
 from ..models.merchant import MerchantApplicationStatus
 
 
@@ -10,7 +10,7 @@ class MerchantApplicationBase(BaseSchema):
     business_description: str
     business_address: str
     business_phone: str
-    business_email: EmailStr
+    business_email: Email
     tax_id: Optional[str] = None
     website_url: Optional[str] = None
 
@@ -30,7 +30,7 @@ class MerchantApplicationUpdate(BaseSchema):
     business_description: Optional[str] = None
     business_address: Optional[str] = None
     business_phone: Optional[str] = None
-    business_email: Optional[EmailStr] = None
+    business_email: Optional[Email] = None
     tax_id: Optional[str] = None
     website_url: Optional[str] = None
 
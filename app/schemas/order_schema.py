@@ -3,6 +3,7 @@ from typing import List, Optional
 from datetime import datetime
 from app.models.order import OrderStatus
 from app.schemas.product_schema import ProductResponse
+from app.schemas.schema_base import RESPONSE_CONFIG
 
 
 class OrderItemResponse(BaseModel):
@@ -15,8 +16,7 @@ class OrderItemResponse(BaseModel):
     total_price: float
     product: Optional[ProductResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class OrderResponse(BaseModel):
@@ -33,8 +33,7 @@ class OrderResponse(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class OrderListResponse(BaseModel):
@@ -45,8 +44,7 @@ class OrderListResponse(BaseModel):
     items_count: int
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = RESPONSE_CONFIG
 
 
 class CheckoutRequest(BaseModel):
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List
-from .schema_base import BaseSchema, IDSchema, TimestampSchema
+from .schema_base import BaseSchema, IDSchema, TimestampSchema, RESPONSE_CONFIG
 from ..models import ProductStatus
 
 
@@ -26,6 +26,8 @@ class ProductUpdate(BaseSchema):
 
 
 class ProductResponse(ProductBase, IDSchema, TimestampSchema):
+    model_config = RESPONSE_CONFIG
+
     status: ProductStatus
     view_count: int
     category_id: int
@@ -79,7 +81,7 @@ class ProductSearch(BaseSchema):
     max_price: Optional[float] = None
     status: Optional[ProductStatus] = None
     featured_only: bool = False
-    page: int = 1
+    cursor: Optional[str] = None
     per_page: int = 20
 
 
@@ -92,6 +94,8 @@ class ProductStats(BaseSchema):
     featured_count: int
 
 class ProductListResponse(BaseSchema):
+    model_config = RESPONSE_CONFIG
+
     id: int
     name: str
     price: float
@@ -1,9 +1,39 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, AfterValidator, WithJsonSchema
 from datetime import datetime
-from typing import Generic, TypeVar, List
+from functools import lru_cache
+from typing import Annotated, Generic, TypeVar, List, Optional
+
+try:
+    from emval import validate_email as _emval_validate
+
+    def _validate_email(value: str):
+        return _emval_validate(value, deliverable_address=False)
+except ImportError:  # emval is optional; email-validator is what EmailStr used
+    from email_validator import validate_email as _email_validator
+
+    def _validate_email(value: str):
+        return _email_validator(value, check_deliverability=False)
 
 T = TypeVar('T')
 
+# Shared by response models: read from ORM objects, reject unknown fields, never revalidate
+# instances, and stay immutable once built (no validating __setattr__)
+RESPONSE_CONFIG = ConfigDict(from_attributes=True, extra="forbid", revalidate_instances="never", frozen=True)
+
+
+@lru_cache(maxsize=4096)
+def _normalized_email(value: str) -> str:
+    """Validate and normalize an address; repeat addresses (logins, resets) hit the cache."""
+    try:
+        return _validate_email(value).normalized
+    except Exception as e:
+        raise ValueError(f"value is not a valid email address: {e}") from None
+
+
+# Drop-in for EmailStr: same normalization, but memoized and backed by emval when installed
+Email = Annotated[str, AfterValidator(_normalized_email), WithJsonSchema({"type": "string", "format": "email"})]
+
+
 class BaseSchema(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
@@ -21,4 +51,22 @@ class PaginatedResponse(BaseSchema, Generic[T]):
     per_page: int
     total_pages: int
     has_next: bool
-    has_prev: bool
\ No newline at end of file
+    has_prev: bool
+
+    @classmethod
+    def build(cls, items: List[T], total: int, page: int, per_page: int) -> "PaginatedResponse[T]":
+        """Construct a page without validation; items must already be validated response models."""
+        return cls.model_construct(
+            items=items,
+            total=total,
+            page=page,
+            per_page=per_page,
+            total_pages=-(-total // per_page),
+            has_next=page * per_page < total,
+            has_prev=page > 1
+        )
+
+class CursorPage(BaseSchema, Generic[T]):
+    items: List[T]
+    next_cursor: Optional[str] = None
+    has_next: bool
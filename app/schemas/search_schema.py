@@ -1,8 +1,11 @@
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Literal
 from app.schemas.product_schema import ProductResponse
 from app.schemas.shop_schema import ShopResponse
 
+SearchSortBy = Literal["relevance", "price", "distance", "popularity", "newest"]
+SortOrder = Literal["asc", "desc"]
+
 
 class SearchQuery(BaseModel):
     q: str = Field(..., min_length=1, max_length=200, description="Search query")
@@ -15,16 +18,8 @@ class SearchQuery(BaseModel):
     location_lat: Optional[float] = Field(None, ge=-90, le=90)
     location_lng: Optional[float] = Field(None, ge=-180, le=180)
     radius_km: Optional[int] = Field(None, ge=1, le=50)
-    sort_by: str = Field(
-        "relevance",
-        pattern="^(relevance|price|distance|popularity|newest)$",
-        description="Sorting method"
-    )
-    sort_order: str = Field(
-        "desc",
-        pattern="^(asc|desc)$",
-        description="Sort order"
-    )
+    sort_by: SearchSortBy = Field("relevance", description="Sorting method")
+    sort_order: SortOrder = Field("desc", description="Sort order")
 
 
 class SearchResult(BaseModel):
@@ -1,29 +1,18 @@
 # app/schemas/shop_crud.py
 from typing import Optional
-from pydantic import EmailStr, field_validator
-from .schema_base import BaseSchema, IDSchema, TimestampSchema
+from typing_extensions import TypedDict
+from pydantic import Field
+from .schema_base import BaseSchema, IDSchema, TimestampSchema, RESPONSE_CONFIG, Email
 
 
 class ShopBase(BaseSchema):
     name: str
     description: Optional[str] = None
     address: str
-    latitude: float
-    longitude: float
+    latitude: float = Field(..., strict=True, ge=-90, le=90)
+    longitude: float = Field(..., strict=True, ge=-180, le=180)
     phone: Optional[str] = None
-    email: Optional[EmailStr] = None
-
-    @field_validator('latitude')
-    def validate_latitude(cls, v):
-        if not -90 <= v <= 90:
-            raise ValueError('Latitude must be between -90 and 90')
-        return v
-
-    @field_validator('longitude')
-    def validate_longitude(cls, v):
-        if not -180 <= v <= 180:
-            raise ValueError('Longitude must be between -180 and 180')
-        return v
+    email: Optional[Email] = None
 
 
 class ShopCreate(ShopBase):
@@ -34,20 +23,32 @@ class ShopUpdate(BaseSchema):
     name: Optional[str] = None
     description: Optional[str] = None
     address: Optional[str] = None
-    latitude: Optional[float] = None
-    longitude: Optional[float] = None
+    latitude: Optional[float] = Field(None, strict=True, ge=-90, le=90)
+    longitude: Optional[float] = Field(None, strict=True, ge=-180, le=180)
     phone: Optional[str] = None
-    email: Optional[EmailStr] = None
+    email: Optional[Email] = None
     is_active: Optional[bool] = None
 
 
 class ShopResponse(ShopBase, IDSchema, TimestampSchema):
+    model_config = RESPONSE_CONFIG
+
     is_active: bool
     merchant_id: int
 
 
+class NearbyShopResponse(ShopResponse):
+    distance_km: float
+
+
+class MerchantBrief(TypedDict):
+    """Basic merchant info embedded in shop responses."""
+    id: int
+    email: str
+
+
 class ShopWithMerchantResponse(ShopResponse):
-    merchant: Optional[dict] = None  # Basic merchant info
+    merchant: Optional[MerchantBrief] = None
 
 
 class ShopSearch(BaseSchema):
@@ -60,6 +61,6 @@ class ShopSearch(BaseSchema):
     per_page: int = 20
 
 
-class ShopStats(BaseSchema):
+class ShopStats(TypedDict):
     total_shops: int
     active_shops: int
\ No newline at end of file
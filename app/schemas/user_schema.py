@@ -1,119 +1,142 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
-from typing import Optional
+import hmac
+
+from pydantic import BaseModel, Field, model_validator
+from typing import Literal, Optional
+from typing_extensions import TypedDict
 from datetime import datetime
 from app.models import UserRole
-
-
-# -------------------------------
-# Reusable Field Mixins
-# -------------------------------
-
-class EmailSchema(BaseModel):
-    email: EmailStr
-
-
-class UniqueIDSchema(BaseModel):
-    unique_id: Optional[str] = None
-
-
-class RoleSchema(BaseModel):
-    role: UserRole = UserRole.USER
-
-
-class VerificationFlagsSchema(BaseModel):
-    is_email_verified: bool = False
-    admin_approval: bool = False
-
-
-class TimestampSchema(BaseModel):
-    created_at: datetime
-    updated_at: datetime
+from app.schemas.schema_base import Email, RESPONSE_CONFIG
+
+__all__ = [
+    "RoleName",
+    "NewPasswordMixin",
+    "UserBase",
+    "UserCreate",
+    "AdminUserCreate",
+    "UserCreateInternal",
+    "UserUpdate",
+    "UserPasswordUpdate",
+    "UserResponse",
+    "LoginBase",
+    "EmailOTP",
+    "AdminLogin",
+    "SuperUserCreate",
+    "SuperUserLogin",
+    "SuperAdmin",
+    "ApproveRequest",
+    "UserFlagData",
+    "ToggleInnerResponse",
+    "ToggleFlagAPIResponse",
+    "LoginUserData",
+    "LoginResponseData",
+    "LoginAPIResponse",
+    "RoleUpdateRequest",
+    "ToggleRoleAPIResponse",
+    "PasswordResetPayloadRequest",
+    "PasswordResetPayload",
+    "ResetOtp",
+]
+
+
+# Role tag for API DTOs: the UserRole values, checked as a plain string set
+RoleName = Literal["user", "merchant", "admin", "SuperAdmin", "Superuser"]
 
 
 # -------------------------------
 # Password Validation Mixins
 # -------------------------------
 
-class PasswordMixin(BaseModel):
-    password: str = Field(..., min_length=8, max_length=128)
-
-
-class ConfirmPasswordMixin(BaseModel):
-    confirm_password: str
+def _same_password(data, field: str, confirm_field: str) -> bool:
+    """
+    Constant-time check on raw input, run before field validation so a mismatch fails early.
 
-    @model_validator(mode="after")
-    def passwords_match(self):
-        if hasattr(self, "password") and self.password != self.confirm_password:
-            raise ValueError("Passwords do not match")
-        return self
+    Non-dict input or missing/non-string values pass through to the regular field errors.
+    """
+    if not isinstance(data, dict):
+        return True
+    password, confirm = data.get(field), data.get(confirm_field)
+    if not isinstance(password, str) or not isinstance(confirm, str):
+        return True
+    return hmac.compare_digest(password.encode(), confirm.encode())
 
 
 class NewPasswordMixin(BaseModel):
     new_password: str = Field(..., min_length=8, max_length=128)
     confirm_new_password: str
 
-    @model_validator(mode="after")
-    def passwords_match(self):
-        if self.new_password != self.confirm_new_password:
+    @model_validator(mode="before")
+    @classmethod
+    def passwords_match(cls, data):
+        if not _same_password(data, "new_password", "confirm_new_password"):
             raise ValueError("New passwords do not match")
-        return self
+        return data
 
 
 # -------------------------------
 # User Schemas
 # -------------------------------
+# Flat, single-inheritance models: every field is declared directly instead of
+# being assembled from mixins, which keeps pydantic-core schema builds cheap.
 
-class UserBase(EmailSchema, RoleSchema, VerificationFlagsSchema, UniqueIDSchema):
-    pass
+class UserBase(BaseModel):
+    email: Email
+    role: UserRole = UserRole.USER
+    is_email_verified: bool = False
+    admin_approval: bool = False
+    unique_id: Optional[str] = None
 
 
 class UserCreate(UserBase):
     pass
 
 
-class UserEmailVerification(UserBase):
-    verification_code: str
-
-
-class UserEmail(UserBase):
-    pass
-
-
-class AdminUserCreate(UserBase, PasswordMixin, ConfirmPasswordMixin):
+class AdminUserCreate(UserBase):
     """Admin user creation schema with password confirmation"""
-    pass
+    password: str = Field(..., min_length=8, max_length=128)
+    confirm_password: str
+
+    @model_validator(mode="before")
+    @classmethod
+    def passwords_match(cls, data):
+        if not _same_password(data, "password", "confirm_password"):
+            raise ValueError("Passwords do not match")
+        return data
 
 
-class UserCreateInternal(EmailSchema, RoleSchema, VerificationFlagsSchema, UniqueIDSchema):
+class UserCreateInternal(UserBase):
     """Internal schema for creating users with hashed password"""
     hashed_password: Optional[str] = None
 
 
-class UserUpdate(EmailSchema, RoleSchema, VerificationFlagsSchema, UniqueIDSchema):
-    email: Optional[EmailStr] = None
+class UserUpdate(BaseModel):
+    email: Optional[Email] = None
     role: Optional[UserRole] = None
     is_email_verified: Optional[bool] = None
     admin_approval: Optional[bool] = None
+    unique_id: Optional[str] = None
 
 
 class UserPasswordUpdate(NewPasswordMixin):
     current_password: str
 
 
-class UserResponse(UserBase, TimestampSchema):
-    model_config = ConfigDict(from_attributes=True)
+class UserResponse(UserBase):
+    model_config = RESPONSE_CONFIG
     id: int
+    created_at: datetime
+    updated_at: datetime
 
 
 # -------------------------------
 # Login Schemas
 # -------------------------------
 
-class LoginBase(EmailSchema):
-    pass
+class LoginBase(BaseModel):
+    email: Email
 
 
-class UserLogin(LoginBase):
+class EmailOTP(LoginBase):
+    """Email plus an optional one-time code: user login and email/reset verification."""
     verification_code: Optional[str] = None
 
 
@@ -141,19 +164,21 @@ class ApproveRequest(LoginBase):
 # -------------------------------
 # Toggle Flag Response
 # -------------------------------
+# Envelopes are TypedDicts: the services return ready-made JSON responses, so these
+# only document the shape and never need model validation of their own.
 
-class UserFlagData(EmailSchema):
+class UserFlagData(LoginBase):
     is_super_admin: Optional[bool] = None
     admin_approval: Optional[bool] = None
     is_email_verified: Optional[bool] = None
 
 
-class ToggleInnerResponse(BaseModel):
+class ToggleInnerResponse(TypedDict):
     message: str
     data: UserFlagData
 
 
-class ToggleFlagAPIResponse(BaseModel):
+class ToggleFlagAPIResponse(TypedDict):
     status_code: int
     detail: str
     data: ToggleInnerResponse
@@ -163,21 +188,25 @@ class ToggleFlagAPIResponse(BaseModel):
 # Login Response
 # -------------------------------
 
-class LoginUserData(EmailSchema, TimestampSchema):
-    role: str
+class LoginUserData(LoginBase):
+    model_config = RESPONSE_CONFIG
+
+    role: UserRole
     is_email_verified: bool
     admin_approval: bool
     unique_id: str
     id: int
+    created_at: datetime
+    updated_at: datetime
 
 
-class LoginResponseData(BaseModel):
+class LoginResponseData(TypedDict):
     access_token: str
     refresh_token: str
     user: LoginUserData
 
 
-class LoginAPIResponse(BaseModel):
+class LoginAPIResponse(TypedDict):
     status_code: int
     detail: str
     data: LoginResponseData
@@ -187,213 +216,27 @@ class LoginAPIResponse(BaseModel):
 # Role & Password Management
 # -------------------------------
 
-class RoleUpdateRequest(EmailSchema):
-    new_role: UserRole
+class RoleUpdateRequest(LoginBase):
+    new_role: RoleName
 
 
-class ToggleRoleAPIResponse(BaseModel):
+class ToggleRoleAPIResponse(TypedDict):
     message: str
     data: dict
 
 
-class PasswordResetPayloadRequest(EmailSchema, UniqueIDSchema):
+class PasswordResetPayloadRequest(LoginBase):
     unique_id: str
     superuser_secret_key: Optional[str] = None
 
 
-class PasswordResetPayload(EmailSchema, UniqueIDSchema, PasswordMixin):
+class PasswordResetPayload(LoginBase):
+    password: str = Field(..., min_length=8, max_length=128)
+    unique_id: Optional[str] = None
     verification_code: str
     superuser_secret_key: Optional[str] = None
 
 
-class EmailVerification(EmailSchema):
-    verification_code: Optional[str] = None
-
-
-class ResetOtp(EmailVerification, PasswordMixin):
+class ResetOtp(EmailOTP):
+    password: str = Field(..., min_length=8, max_length=128)
     otp: str
-
-# from pydantic import BaseModel, EmailStr, Field, ConfigDict
-# from typing import Optional
-# from datetime import datetime
-#
-# from app.models import UserRole
-#
-#
-# # -------------------------------
-# # Base User Schemas
-# # -------------------------------
-#
-# class UserBase(BaseModel):
-#     email: EmailStr
-#     role: UserRole = UserRole.USER
-#     is_email_verified: bool = False
-#     admin_approval: bool = False
-#     unique_id: Optional[str] = None
-#
-#
-# class UserCreate(UserBase):
-#     pass
-#
-#
-# class UserEmailVerification(UserBase):
-#     verification_code: str
-#
-#
-# class UserEmail(UserBase):
-#     pass
-#
-#
-# class AdminUserCreate(UserBase):
-#     password: str = Field(..., min_length=8, description="Password must be at least 8 characters")
-#     confirm_password: str = Field(..., description="Password confirmation")
-#
-#     def validate_passwords_match(self):
-#         if self.password != self.confirm_password:
-#             raise ValueError("Passwords do not match")
-#         return self
-#
-#
-# class UserCreateInternal(BaseModel):
-#     """Internal schema for creating users with hashed password"""
-#     email: EmailStr
-#     hashed_password: Optional[str] = None
-#     role: UserRole = UserRole.USER
-#     is_email_verified: bool = False
-#     admin_approval: bool = False
-#     unique_id: Optional[str] = None
-#
-#
-# class UserUpdate(BaseModel):
-#     email: Optional[EmailStr] = None
-#     role: Optional[UserRole] = None
-#     is_email_verified: Optional[bool] = None
-#     admin_approval: Optional[bool] = None
-#     unique_id: Optional[str] = None
-#
-#
-# class UserPasswordUpdate(BaseModel):
-#     current_password: str
-#     new_password: str = Field(..., min_length=8)
-#     confirm_new_password: str
-#
-#     def validate_passwords_match(self):
-#         if self.new_password != self.confirm_new_password:
-#             raise ValueError("New passwords do not match")
-#         return self
-#
-#
-# class UserResponse(UserBase):
-#     model_config = ConfigDict(from_attributes=True)
-#
-#     id: int
-#     created_at: datetime
-#     updated_at: datetime
-#
-#
-# # -------------------------------
-# # Login Schemas
-# # -------------------------------
-#
-# class LoginBase(BaseModel):
-#     email: EmailStr
-#
-#
-# class UserLogin(LoginBase):
-#     verification_code: Optional[str] = None
-#
-#
-# class AdminLogin(LoginBase):
-#     password: str
-#     unique_id: str
-#
-#
-# class SuperUserCreate(AdminLogin):
-#     superuser_secret_key: str
-#
-#
-# class SuperUserLogin(AdminLogin):
-#     pass
-#
-# class SuperAdmin(AdminLogin):
-#     pass
-#
-#
-# class ApproveRequest(LoginBase):
-#     pass
-#
-#
-# # -------------------------------
-# # Toggle Flag Response
-# # -------------------------------
-#
-# class UserFlagData(BaseModel):
-#     email: EmailStr
-#     is_super_admin: Optional[bool] = None
-#     admin_approval: Optional[bool] = None
-#     is_email_verified: Optional[bool] = None
-#
-#
-# class ToggleInnerResponse(BaseModel):
-#     message: str
-#     data: UserFlagData
-#
-#
-# class ToggleFlagAPIResponse(BaseModel):
-#     status_code: int
-#     detail: str
-#     data: ToggleInnerResponse
-#
-#
-# # -------------------------------
-# # Login Response
-# # -------------------------------
-#
-# class LoginUserData(BaseModel):
-#     email: EmailStr
-#     role: str
-#     is_email_verified: bool
-#     admin_approval: bool
-#     unique_id: str
-#     id: int
-#     created_at: datetime
-#     updated_at: datetime
-#
-#
-# class LoginResponseData(BaseModel):
-#     access_token: str
-#     refresh_token: str
-#     user: LoginUserData
-#
-#
-# class LoginAPIResponse(BaseModel):
-#     status_code: int
-#     detail: str
-#     data: LoginResponseData
-#
-# class RoleUpdateRequest(BaseModel):
-#     email: EmailStr
-#     new_role: UserRole
-#
-# class ToggleRoleAPIResponse(BaseModel):
-#     message: str
-#     data: dict
-#
-# class PasswordResetPayloadRequest(BaseModel):
-#     email: EmailStr
-#     unique_id: str
-#
-# class PasswordResetPayload(BaseModel):
-#     email: EmailStr
-#     verification_code: str
-#     new_password: str
-#     unique_id: Optional[str] = None
-#     superuser_secret_key: Optional[str] = None
-#
-# class EmailVerification(BaseModel):
-#     email: EmailStr
-#     verification_code: Optional[str] = None
-#
-# class ResetOtp(EmailVerification):
-#     otp: str
-#     new_password: str
\ No newline at end of file
@@ -0,0 +1,19 @@
+import os
+
+# Settings() is built at import time; give it enough to load without a real environment
+_TEST_SECRET = "test-secret-key-with-at-least-32-chars"
+for name, value in {
+    "APP_ENV": "test",
+    "APP_SECRET_KEY": _TEST_SECRET,
+    "POSTGRES_USER": "xsell",
+    "POSTGRES_PASSWORD": "xsell",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_DB": "xsell_test",
+    "API_SUPERUSER_USERNAME": "superuser",
+    "API_SUPERUSER_PASSWORD": "superuser",
+    "API_SUPERUSER_EMAIL": "superuser@example.com",
+    "API_SUPERUSER_SECRET_KEY": _TEST_SECRET,
+    "JWT_SECRET_KEY": _TEST_SECRET,
+    "CORS_ALLOWED_ORIGINS": "http://localhost",
+}.items():
+    os.environ.setdefault(name, value)
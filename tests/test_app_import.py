@@ -0,0 +1,20 @@
+import importlib
+
+
+def test_app_main_imports():
+    main = importlib.import_module("app.main")
+    assert main.app is not None
+
+
+def test_schemas_package_imports():
+    schemas = importlib.import_module("app.schemas")
+    assert schemas.UserResponse is not None
+
+
+def test_product_and_shop_routers_import():
+    products = importlib.import_module("app.routes.endpoints.products_routes")
+    shops = importlib.import_module("app.routes.endpoints.shops_routes")
+    product_paths = {route.path for route in products.router.routes}
+    shop_paths = {route.path for route in shops.router.routes}
+    assert {"/products/", "/products/{product_id}"} <= product_paths
+    assert {"/shops/", "/shops/{shop_id}", "/shops/my-shops"} <= shop_paths
@@ -0,0 +1,110 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core import cache as cache_module
+from app.core.cache import cache, cached_json
+from app.core.dependencies import get_merchant_status
+from app.core.tasks import record_product_view
+from app.core.utils.etag import get_version
+from app.crud.merchant_crud import merchant_crud
+from app.models.merchant import MerchantApplicationStatus
+
+
+class _BrokenBackend:
+    """Backend whose every call fails, like Redis being unreachable."""
+
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+    async def set(self, key, value, ttl=None):
+        raise ConnectionError("redis down")
+
+    async def get_many(self, keys):
+        raise ConnectionError("redis down")
+
+    async def set_many(self, mapping, ttl=None):
+        raise ConnectionError("redis down")
+
+    async def hincr(self, name, field, amount=1):
+        raise ConnectionError("redis down")
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    asyncio.run(cache.close())
+    yield
+    asyncio.run(cache.close())
+
+
+def test_concurrent_misses_share_one_producer_run():
+    calls = 0
+
+    async def producer():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"value": 1}
+
+    async def run():
+        return await asyncio.gather(*(cached_json("coalesce", 60, producer) for _ in range(20)))
+
+    responses = asyncio.run(run())
+    assert calls == 1
+    assert {response.body for response in responses} == {b'{"value":1}'}
+    assert not cache_module._inflight
+
+
+def test_failed_leader_hands_off_to_a_single_new_leader():
+    calls = 0
+
+    async def producer():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        if calls == 1:
+            raise RuntimeError("database unavailable")
+        return {"value": 2}
+
+    async def run():
+        return await asyncio.gather(
+            *(cached_json("handoff", 60, producer) for _ in range(4)),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+    assert isinstance(results[0], RuntimeError)
+    assert [response.body for response in results[1:]] == [b'{"value":2}'] * 3
+    assert calls == 2
+    assert not cache_module._inflight
+
+
+def test_cache_backend_errors_fall_back_to_producer(monkeypatch):
+    monkeypatch.setattr(cache, "_backend", _BrokenBackend())
+
+    async def producer():
+        return {"value": 3}
+
+    response = asyncio.run(cached_json("broken", 60, producer))
+    assert response.body == b'{"value":3}'
+
+
+def test_cache_backed_helpers_survive_backend_errors(monkeypatch):
+    monkeypatch.setattr(cache, "_backend", _BrokenBackend())
+
+    async def get_user_application(db, user_id):
+        return SimpleNamespace(status=MerchantApplicationStatus.APPROVED)
+
+    monkeypatch.setattr(merchant_crud, "get_user_application", get_user_application)
+
+    async def run():
+        await record_product_view(1)
+        return await get_version("products"), await get_version("products"), await get_merchant_status(None, 1)
+
+    first, second, merchant_status = asyncio.run(run())
+    assert first != second  # Nothing was stored, so no ETag built on it can match
+    assert merchant_status == MerchantApplicationStatus.APPROVED.value
@@ -0,0 +1,46 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from starlette.requests import Request
+
+from app.core import cache as cache_module
+from app.core.cache import cache
+from app.core.utils.etag import http_date, unmodified_since, get_version, bump_version
+
+UPDATED_AT = datetime(2026, 3, 1, 12, 30, 15, 250000, tzinfo=timezone.utc)
+
+
+def _request(**headers) -> Request:
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_unmodified_since_same_second():
+    assert unmodified_since(_request(if_modified_since=http_date(UPDATED_AT)), UPDATED_AT)
+
+
+def test_modified_after_header_date():
+    earlier = http_date(UPDATED_AT - timedelta(seconds=1))
+    assert not unmodified_since(_request(if_modified_since=earlier), UPDATED_AT)
+
+
+def test_header_ignored_when_missing_invalid_or_with_if_none_match():
+    assert not unmodified_since(_request(), UPDATED_AT)
+    assert not unmodified_since(_request(if_modified_since="yesterday"), UPDATED_AT)
+    later = http_date(UPDATED_AT + timedelta(days=1))
+    assert not unmodified_since(_request(if_modified_since=later, if_none_match='W/"1-2"'), UPDATED_AT)
+
+
+def test_versions_expire_without_a_shared_cache(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+
+    async def run():
+        await cache.close()
+        await bump_version("etag-test")
+        first = await get_version("etag-test")
+        now[0] += 31  # Past LOCAL_VERSION_TTL: a bump on another worker is picked up
+        return first, await get_version("etag-test")
+
+    first, second = asyncio.run(run())
+    assert second != first
@@ -0,0 +1,146 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.cache import cache
+from app.core.database import get_async_db
+from app.core.dependencies import _current_user
+from app.core.utils.etag import http_date, weak_etag
+from app.models import ProductStatus, UserRole
+from app.routes.endpoints import cart, products_routes, shops_routes
+
+UPDATED_AT = datetime(2026, 3, 1, 12, 30, 15, tzinfo=timezone.utc)
+UPDATED_AT_VERSION = int(UPDATED_AT.timestamp() * 1000)
+
+
+async def _no_db():
+    yield None
+
+
+@pytest.fixture
+def client():
+    asyncio.run(cache.close())
+    app = FastAPI()
+    app.include_router(products_routes.router)
+    app.include_router(shops_routes.router)
+    app.include_router(cart.router, prefix="/cart")
+    app.dependency_overrides[get_async_db] = _no_db
+    app.dependency_overrides[_current_user] = lambda: SimpleNamespace(id=1, role=UserRole.USER)
+    with TestClient(app) as test_client:
+        yield test_client
+    asyncio.run(cache.close())
+
+
+# -------------------- PRODUCTS --------------------
+def test_product_search_returns_the_next_cursor(client, monkeypatch):
+    async def search_products(db, **kwargs):
+        assert kwargs["cursor"] == "page-1"
+        return [], "page-2"
+
+    monkeypatch.setattr(products_routes.product_crud, "search_products", search_products)
+
+    response = client.get("/products/", params={"cursor": "page-1"})
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "next_cursor": "page-2", "has_next": True}
+
+
+def test_product_search_rejects_a_bad_cursor(client, monkeypatch):
+    async def search_products(db, **kwargs):
+        raise ValueError("bad cursor")
+
+    monkeypatch.setattr(products_routes.product_crud, "search_products", search_products)
+
+    assert client.get("/products/", params={"cursor": "garbage"}).status_code == 400
+
+
+def test_featured_products_answer_304_for_a_matching_etag(client, monkeypatch):
+    async def get_featured_products(db, limit):
+        return []
+
+    monkeypatch.setattr(products_routes.product_crud, "get_featured_products", get_featured_products)
+
+    first = client.get("/products/featured")
+    assert first.status_code == 200
+    second = client.get("/products/featured", headers={"If-None-Match": first.headers["ETag"]})
+    assert second.status_code == 304
+
+
+def test_product_detail_etag_and_inactive_product(client, monkeypatch):
+    row = SimpleNamespace(status=ProductStatus.ACTIVE, updated_at=UPDATED_AT)
+
+    async def get(db, obj_id, columns=None):
+        return row
+
+    monkeypatch.setattr(products_routes.product_crud, "get", get)
+    etag = weak_etag(5, UPDATED_AT_VERSION)
+
+    assert client.get("/products/5", headers={"If-None-Match": etag}).status_code == 304
+    row.status = ProductStatus.INACTIVE
+    assert client.get("/products/5", headers={"If-None-Match": etag}).status_code == 404
+
+
+# -------------------- SHOPS --------------------
+def _shop(**overrides):
+    shop = dict(
+        id=3, name="Corner shop", description=None, address="1 Main St", latitude=6.5, longitude=3.4,
+        phone=None, email=None, is_active=True, merchant_id=1, created_at=UPDATED_AT, updated_at=UPDATED_AT
+    )
+    shop.update(overrides)
+    return SimpleNamespace(**shop)
+
+
+def test_shop_detail_conditional_requests(client, monkeypatch):
+    shop = _shop()
+
+    async def get(db, obj_id, columns=None):
+        return shop
+
+    monkeypatch.setattr(shops_routes.shop_crud, "get", get)
+
+    response = client.get("/shops/3")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Corner shop"
+    assert response.headers["Last-Modified"] == http_date(UPDATED_AT)
+
+    assert client.get("/shops/3", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get("/shops/3", headers={"If-Modified-Since": http_date(UPDATED_AT)}).status_code == 304
+
+    shop.is_active = False
+    assert client.get("/shops/3", headers={"If-None-Match": response.headers["ETag"]}).status_code == 404
+
+
+def test_my_shops_cursor_and_bad_cursor(client, monkeypatch):
+    async def get_merchant_shops(db, merchant_id, active_only, cursor=None, limit=20):
+        if cursor == "garbage":
+            raise ValueError("bad cursor")
+        return [_shop()], "next"
+
+    monkeypatch.setattr(shops_routes.shop_crud, "get_merchant_shops", get_merchant_shops)
+
+    response = client.get("/shops/my-shops")
+    assert response.status_code == 200
+    assert response.json()["next_cursor"] == "next" and response.json()["has_next"] is True
+    assert client.get("/shops/my-shops", headers={"If-None-Match": response.headers["ETag"]}).status_code == 304
+    assert client.get("/shops/my-shops", params={"cursor": "garbage"}).status_code == 400
+
+
+# -------------------- CART --------------------
+def test_add_to_cart_rejects_unavailable_products(client, monkeypatch):
+    async def add_to_cart(db, user_id, product_id, quantity):
+        raise ValueError("Insufficient stock")
+
+    monkeypatch.setattr(cart.cart_crud, "add_to_cart", add_to_cart)
+
+    response = client.post("/cart/items", json={"product_id": 9, "quantity": 2})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Insufficient stock"
+
+
+def test_cart_line_price_falls_back_to_the_stored_price():
+    assert cart._line_price({"price": 12.5}, 10.0) == 12.5
+    assert cart._line_price({"price": None}, 10.0) == 10.0
+    assert cart._line_price({}, 10.0) == 10.0
@@ -0,0 +1,29 @@
+import asyncio
+import time
+
+from fastapi import HTTPException
+
+from app.core import security
+
+
+def test_kdf_callers_time_out_before_their_hash_starts(monkeypatch):
+    monkeypatch.setattr(security, "_password_slots", asyncio.Semaphore(1))
+    monkeypatch.setattr(security, "PASSWORD_KDF_TIMEOUT_SECONDS", 0.05)
+    started = []
+
+    def slow_hash(value):
+        started.append(value)
+        time.sleep(0.2)
+        return value
+
+    async def run():
+        return await asyncio.gather(
+            security._run_kdf(slow_hash, "first"),
+            security._run_kdf(slow_hash, "second"),
+            return_exceptions=True
+        )
+
+    first, second = asyncio.run(run())
+    assert first == "first"
+    assert isinstance(second, HTTPException) and second.status_code == 503
+    assert started == ["first"]  # The timed-out caller never occupied a pool worker
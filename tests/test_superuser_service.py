@@ -0,0 +1,37 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.auth_service import superuser_service
+from app.models import UserRole
+
+
+@pytest.fixture
+def user_exists(monkeypatch):
+    state = {"exists": False}
+
+    async def exists(db, filters=None, **kwargs):
+        return state["exists"]
+
+    monkeypatch.setattr(superuser_service.user_crud, "exists", exists)
+    return state
+
+
+def _toggle(flag: str):
+    actor = SimpleNamespace(role=UserRole.SUPERUSER)
+    return asyncio.run(superuser_service.toggle_flag(None, actor, "nobody@example.com", flag))
+
+
+def test_unknown_user_is_reported_before_an_invalid_flag(user_exists):
+    with pytest.raises(HTTPException) as exc:
+        _toggle("not_a_flag")
+    assert exc.value.status_code == 404
+
+
+def test_invalid_flag_on_known_user(user_exists):
+    user_exists["exists"] = True
+    with pytest.raises(HTTPException) as exc:
+        _toggle("not_a_flag")
+    assert exc.value.status_code == 400
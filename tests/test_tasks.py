@@ -0,0 +1,24 @@
+import asyncio
+
+import pytest
+
+from app.core import tasks
+from app.core.cache import cache
+
+
+def test_failed_flush_returns_counts_to_the_buffer(monkeypatch):
+    async def apply_view_counts(db, counts):
+        raise ConnectionError("database unavailable")
+
+    monkeypatch.setattr(tasks.product_crud, "apply_view_counts", apply_view_counts)
+
+    async def run():
+        await cache.close()
+        await tasks.record_product_view(7)
+        await tasks.record_product_view(7)
+        with pytest.raises(ConnectionError):
+            await tasks.flush_product_views()
+        await tasks.record_product_view(7)
+        return await cache.hpop_all(tasks.PRODUCT_VIEWS_KEY)
+
+    assert asyncio.run(run()) == {"7": 3}
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.models import UserRole
+from app.schemas.user_schema import LoginUserData, RoleUpdateRequest
+
+
+def test_login_user_data_accepts_orm_role_enum():
+    now = datetime.now(timezone.utc)
+    user = SimpleNamespace(
+        id=1,
+        email="user@example.com",
+        role=UserRole.USER,
+        is_email_verified=True,
+        admin_approval=False,
+        unique_id="US0000000001",
+        created_at=now,
+        updated_at=now
+    )
+
+    data = LoginUserData.model_validate(user)
+    assert data.role is UserRole.USER
+    assert data.model_dump(mode="json")["role"] == "user"
+
+
+def test_role_update_request_takes_role_names():
+    request = RoleUpdateRequest(email="user@example.com", new_role="merchant")
+    assert request.new_role == "merchant"